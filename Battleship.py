@@ -1,11 +1,16 @@
 import random
+import sys
 import time
-import os
+from collections import namedtuple
+
+from first import parse_options
+from instrumentation import DISABLED, metrics_for
 
 # מחלקת עיצוב מתקדמת
 class Style:
     CYAN = '\033[96m'
     MAGENTA = '\033[95m'
+    BLUE = '\033[94m'
     YELLOW = '\033[93m'
     GREEN = '\033[92m'
     RED = '\033[91m'
@@ -14,116 +19,257 @@ class Style:
     RESET = '\033[0m'
     CLEAR = '\033[H\033[J'
 
+# A screen line made of single-width cells on a fixed grid, so it can be patched cell by cell
+CellRow = namedtuple('CellRow', 'prefix cells sep')
+
+def _line_text(line):
+    return line.prefix + line.sep.join(line.cells) if isinstance(line, CellRow) else line
+
+class ScreenRenderer:
+    """Draws frames of lines in place, rewriting only what changed since the last frame.
+
+    The first frame clears the screen with Style.CLEAR. Later frames move the
+    cursor to each changed line (or, for CellRows, each changed cell) and
+    then wipe everything below the frame, where the last turn's prompts were.
+    """
+
+    def __init__(self, out=None):
+        self.out = out or sys.stdout
+        self._last = None
+
+    def invalidate(self):
+        """Force the next frame to be drawn from scratch."""
+        self._last = None
+
+    def draw(self, lines):
+        parts = []
+        if self._last is None or len(self._last) != len(lines):
+            parts.append(Style.CLEAR)
+            parts.extend(_line_text(line) + "\n" for line in lines)
+        else:
+            for row, (old, new) in enumerate(zip(self._last, lines), 1):
+                if old == new:
+                    continue
+                if (isinstance(old, CellRow) and isinstance(new, CellRow)
+                        and old.prefix == new.prefix and len(old.cells) == len(new.cells)):
+                    stride = 1 + len(new.sep)
+                    for i, (before, after) in enumerate(zip(old.cells, new.cells)):
+                        if before != after:
+                            parts.append(f"\033[{row};{len(new.prefix) + i * stride + 1}H{after}")
+                else:
+                    parts.append(f"\033[{row};1H{_line_text(new)}\033[K")
+            parts.append(f"\033[{len(lines) + 1};1H\033[J")
+        self._last = list(lines)
+        self.out.write(''.join(parts))
+        self.out.flush()
+
+class Pacer:
+    """Timed pauses for animations and messages.
+
+    In fast mode every pause returns at once. Otherwise, on a terminal,
+    pressing Enter cuts the current pause short.
+    """
+
+    def __init__(self, fast=False):
+        self.fast = fast
+
+    def pause(self, seconds):
+        """Wait up to `seconds`; return False if the wait was skipped."""
+        if self.fast or seconds <= 0:
+            return False
+        stdin = sys.stdin
+        try:
+            interactive = stdin is not None and stdin.isatty()
+        except ValueError:
+            interactive = False
+        if interactive:
+            try:
+                import select
+                ready, _, _ = select.select([stdin], [], [], seconds)
+            except (ImportError, OSError, ValueError):
+                pass  # no select() on console handles (Windows): fall back to sleeping
+            else:
+                if ready:
+                    stdin.readline()
+                    return False
+                return True
+        time.sleep(seconds)
+        return True
+
 class ProfessionalBattleship:
-    def __init__(self):
+    def __init__(self, fast=False, out=None, input_func=input, seed=None, metrics=DISABLED):
         self.size = 15
         self.ship_size = 3
         self.max_missiles = 8
         self.radar_uses = 2
         self.board = ["_"] * self.size
+        # The same seed always hides the ship in the same place
+        self.seed = seed if seed is not None else random.randrange(1 << 32)
+        self.rng = random.Random(self.seed)
         # מיקום ספינה רב-תאית (רצף של תאים)
-        start_pos = random.randint(0, self.size - self.ship_size)
+        start_pos = self.rng.randint(0, self.size - self.ship_size)
         self.ship_coords = set(range(start_pos, start_pos + self.ship_size))
         self.hits = set()
         self.misses = set()
         self.score = 0
+        self.actions = []  # (kind, target) in play order, kind 'fire' or 'radar'
+        # Rendered cells, updated as shots land instead of rebuilt every frame
+        self.cells = [f"{Style.CYAN}_{Style.RESET}"] * self.size
+        self.out = out or sys.stdout
+        self.input = input_func
+        self.pacer = Pacer(fast)
+        self.renderer = ScreenRenderer(self.out)
+        self.metrics = metrics
 
-    def clear_screen(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
-
-    def draw_header(self):
-        print(f"{Style.MAGENTA}{'='*45}")
-        print(f"{Style.BOLD}   B A T T L E S H I P :  D E E P  S E A   ")
-        print(f"{Style.MAGENTA}{'='*45}{Style.RESET}")
-        
+    def header_lines(self):
         # תצוגת סטטוס
         status = f"Missiles: {Style.RED}{'🚀' * (self.max_missiles - len(self.misses))}{Style.RESET}"
         radars = f"Radars: {Style.CYAN}{'📡' * self.radar_uses}{Style.RESET}"
-        print(f"{status}  |  {radars}  |  Hits: {len(self.hits)}/{self.ship_size}")
-        print("-" * 45)
-
-    def draw_board(self, reveal=False):
-        display = []
-        for i in range(self.size):
-            if i in self.hits:
-                display.append(f"{Style.RED}X{Style.RESET}")
-            elif i in self.misses:
-                display.append(f"{Style.YELLOW}O{Style.RESET}")
-            elif reveal and i in self.ship_coords:
-                display.append(f"{Style.GREEN}S{Style.RESET}")
-            else:
-                display.append(f"{Style.CYAN}_{Style.RESET}")
-        
-        print("\nIndex: " + " ".join(f"{i:2}" for i in range(self.size)))
-        print("Board: " + "  ".join(display) + "\n")
+        return [
+            f"{Style.MAGENTA}{'='*45}",
+            f"{Style.BOLD}   B A T T L E S H I P :  D E E P  S E A   ",
+            f"{Style.MAGENTA}{'='*45}{Style.RESET}",
+            f"{status}  |  {radars}  |  Hits: {len(self.hits)}/{self.ship_size}",
+            "-" * 45,
+        ]
 
-    def use_radar(self, center):
+    def board_lines(self, reveal=False):
+        cells = list(self.cells)
+        if reveal:
+            for i in self.ship_coords - self.hits:
+                cells[i] = f"{Style.GREEN}S{Style.RESET}"
+        return [
+            "",
+            "Index: " + " ".join(f"{i:2}" for i in range(self.size)),
+            CellRow("Board: ", tuple(cells), "  "),
+            "",
+        ]
+
+    def render(self, reveal=False):
+        """Bring the screen up to date, redrawing only what changed."""
+        self.renderer.draw(self.header_lines() + self.board_lines(reveal))
+
+    def say(self, message="", end="\n"):
+        self.out.write(message + end)
+        self.out.flush()
+
+    def use_radar(self, center, radius=1):
         """סורק רדיוס של תא אחד מסביב לניחוש"""
+        if not 0 <= center < self.size:
+            raise ValueError(f"Target {center} is off the board")
         self.radar_uses -= 1
-        found = False
-        scan_range = range(max(0, center-1), min(self.size, center+2))
-        for i in scan_range:
-            if i in self.ship_coords:
-                found = True
-        return found
+        self.actions.append(('radar', center))
+        scan_range = range(max(0, center - radius), min(self.size, center + radius + 1))
+        return not self.ship_coords.isdisjoint(scan_range)
+
+    def shoot(self, target):
+        """Resolve a shot without any output or delay; True on a hit."""
+        self.actions.append(('fire', target))
+        if target in self.ship_coords:
+            self.hits.add(target)
+            self.cells[target] = f"{Style.RED}X{Style.RESET}"
+            return True
+        self.misses.add(target)
+        self.cells[target] = f"{Style.YELLOW}O{Style.RESET}"
+        return False
+
+    def is_over(self):
+        return len(self.misses) >= self.max_missiles or len(self.hits) >= self.ship_size
 
     def fire_missile(self, target):
-        print(f"\n{Style.BOLD}Launching Missile...{Style.RESET}", end="", flush=True)
+        self.say(f"\n{Style.BOLD}Launching Missile...{Style.RESET}", end="")
+        animate = True
         for _ in range(3):
-            time.sleep(0.3)
-            print(".", end="", flush=True)
+            animate = animate and self.pacer.pause(0.3)
+            self.say(".", end="")
         
-        if target in self.ship_coords:
-            self.hits.add(target)
+        with self.metrics.stage('shot'):
+            hit = self.shoot(target)
+        self.metrics.count('shots', result='hit' if hit else 'miss')
+        if hit:
             return f"\n{Style.GREEN}{Style.BOLD}DIRECT HIT!{Style.RESET}"
         else:
-            self.misses.add(target)
             return f"\n{Style.RED}Splash... Miss.{Style.RESET}"
 
     def run(self):
-        while len(self.misses) < self.max_missiles and len(self.hits) < self.ship_size:
-            self.clear_screen()
-            self.draw_header()
-            self.draw_board()
+        while not self.is_over():
+            self.metrics.tick()
+            with self.metrics.stage('render'):
+                self.render()
 
-            choice = input(f"Choose action: ({Style.BOLD}F{Style.RESET}ire / {Style.BOLD}R{Style.RESET}adar): ").lower()
+            choice = self.input(f"Choose action: ({Style.BOLD}F{Style.RESET}ire / {Style.BOLD}R{Style.RESET}adar): ").lower()
 
             if choice == 'r' and self.radar_uses > 0:
                 try:
-                    target = int(input("Where to scan? "))
-                    if self.use_radar(target):
-                        print(f"{Style.GREEN}Radar detected metal in the area!{Style.RESET}")
+                    target = int(self.input("Where to scan? "))
+                    if not (0 <= target < self.size):
+                        self.metrics.count('rejected', reason='invalid_target')
+                        self.say("Invalid target.")
+                        self.pacer.pause(1)
+                        continue
+                    with self.metrics.stage('radar'):
+                        found = self.use_radar(target)
+                    self.metrics.count('radar_scans')
+                    if found:
+                        self.say(f"{Style.GREEN}Radar detected metal in the area!{Style.RESET}")
                     else:
-                        print(f"{Style.BLUE}Area is clear. Nothing found.{Style.RESET}")
-                    time.sleep(2)
-                except ValueError: pass
+                        self.say(f"{Style.BLUE}Area is clear. Nothing found.{Style.RESET}")
+                    self.pacer.pause(2)
+                except ValueError as e:
+                    self.metrics.error(e)
                 continue
 
             try:
-                target = int(input("Enter target coordinate: "))
+                target = int(self.input("Enter target coordinate: "))
                 if not (0 <= target < self.size) or target in self.hits or target in self.misses:
-                    print("Invalid target or already hit.")
-                    time.sleep(1)
+                    self.metrics.count('rejected', reason='invalid_target')
+                    self.say("Invalid target or already hit.")
+                    self.pacer.pause(1)
                     continue
 
                 result = self.fire_missile(target)
-                print(result)
-                time.sleep(1.5)
+                self.say(result)
+                self.pacer.pause(1.5)
 
-            except ValueError:
+            except ValueError as e:
+                self.metrics.error(e)
                 continue
 
         self.end_game()
 
     def end_game(self):
-        self.clear_screen()
-        self.draw_header()
-        self.draw_board(reveal=True)
+        with self.metrics.stage('render'):
+            self.render(reveal=True)
+        self.metrics.count('games_played', result='won' if len(self.hits) == self.ship_size else 'lost')
         if len(self.hits) == self.ship_size:
-            print(f"{Style.GREEN}{Style.BOLD}MISSION ACCOMPLISHED! Enemy fleet destroyed.{Style.RESET}")
+            self.say(f"{Style.GREEN}{Style.BOLD}MISSION ACCOMPLISHED! Enemy fleet destroyed.{Style.RESET}")
         else:
-            print(f"{Style.RED}{Style.BOLD}MISSION FAILED. You ran out of ammo.{Style.RESET}")
+            self.say(f"{Style.RED}{Style.BOLD}MISSION FAILED. You ran out of ammo.{Style.RESET}")
+
+def _parser(argparse):
+    parser = argparse.ArgumentParser(description="Battleship: Deep Sea.")
+    parser.add_argument('--fast', action='store_true', help="no animations or pauses")
+    parser.add_argument('--seed', type=int, default=None, help="replay the same ship placement")
+    parser.add_argument('--record', metavar='PATH', help="append the finished game to a move log")
+    parser.add_argument('--metrics', metavar='PATH',
+                        help="write stage timings and counters to PATH (Prometheus text if it ends in .prom, else JSON)")
+    return parser
+
+def cli(argv=None):
+    """Command-line entry point, also used by first.py."""
+    args = parse_options(argv, _parser)
+    fast, seed, record, metrics = False, None, None, DISABLED
+    if args:
+        fast, seed, record = args.fast, args.seed, args.record
+        metrics = metrics_for(args.metrics, 'battleship')
+    game = ProfessionalBattleship(fast=fast, seed=seed, metrics=metrics)
+    try:
+        game.run()
+    finally:
+        metrics.close()
+    if record:
+        from replay_log import append_records, battleship_record
+        append_records(record, [battleship_record(game)])
 
 if __name__ == "__main__":
-    game = ProfessionalBattleship()
-    game.run()
\ No newline at end of file
+    cli()
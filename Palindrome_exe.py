@@ -1,4 +1,9 @@
-import string
+from first import parse_options
+from instrumentation import DISABLED, metrics_for
+from normalizer import DIGITS_ONLY, EMPTY_TEXT, NO_LETTERS, NOTHING_LEFT, get_normalizer
+
+# Compiled translate tables for the classic clean_text rules
+_normalizer = get_normalizer()
 
 def clean_text(text):
     """Remove spaces, punctuation and convert to lowercase."""
@@ -7,8 +12,7 @@ def clean_text(text):
             raise TypeError("Input must be a string")
         
         # Remove punctuation and spaces, then convert to lowercase
-        cleaned = ''.join(char.lower() for char in text 
-                         if char not in string.punctuation and char != ' ')
+        cleaned = _normalizer.clean(text)
         return cleaned
     except TypeError as e:
         print(f"Error: {e}")
@@ -21,22 +25,22 @@ def is_palindrome(text):
     """Check if the cleaned text is a palindrome."""
     try:
         if not text:
-            raise ValueError("Cannot check empty text")
+            raise ValueError(EMPTY_TEXT)
         
         # Check if input contains only digits
         if text.strip().isdigit():
-            raise ValueError("Numbers are not allowed. Please enter text with letters.")
+            raise ValueError(DIGITS_ONLY)
         
-        cleaned = clean_text(text)
+        has_letter = _normalizer.letter_state(text)
         
-        if not cleaned:
-            raise ValueError("No valid characters to check after cleaning")
+        if has_letter is None:
+            raise ValueError(NOTHING_LEFT)
         
         # Check if cleaned text has at least one letter
-        if not any(c.isalpha() for c in cleaned):
-            raise ValueError("Input must contain at least one letter")
+        if not has_letter:
+            raise ValueError(NO_LETTERS)
         
-        return cleaned == cleaned[::-1]
+        return _normalizer.is_mirrored(text)
     except ValueError as e:
         print(f"Error: {e}")
         return False
@@ -44,56 +48,63 @@ def is_palindrome(text):
         print(f"Unexpected error in is_palindrome: {e}")
         return False
 
-def check_and_display(text, palindrome_count, encouragement_messages):
+def check_and_display(text, palindrome_count, encouragement_messages, metrics=DISABLED):
     """Check palindrome and display original, cleaned text, and result."""
     try:
         if not text:
-            raise ValueError("Cannot check empty text")
+            raise ValueError(EMPTY_TEXT)
         
         # Check if input contains only digits
         if text.strip().isdigit():
-            print("Error: Numbers are not allowed. Please enter text with letters.\n")
+            metrics.count('rejected', reason='digits')
+            print(f"Error: {DIGITS_ONLY}\n")
             return None
         
-        cleaned = clean_text(text)
+        with metrics.stage('normalize'):
+            cleaned = clean_text(text)
         
         if not cleaned:
-            print("Error: No valid characters to check after cleaning\n")
+            metrics.count('rejected', reason='no_valid_characters')
+            print(f"Error: {NOTHING_LEFT}\n")
             return None
         
         # Check if cleaned text has at least one letter
         if not any(c.isalpha() for c in cleaned):
-            print("Error: Input must contain at least one letter\n")
+            metrics.count('rejected', reason='no_letters')
+            print(f"Error: {NO_LETTERS}\n")
             return None
         
         # Check palindrome
-        is_palin = cleaned == cleaned[::-1]
+        with metrics.stage('check'):
+            is_palin = cleaned == cleaned[::-1]
+        metrics.count('checks', result='palindrome' if is_palin else 'not_palindrome')
         
         # Display results
-        print(f"Original input: '{text}'")
-        print(f"Cleaned text: '{cleaned}'")
-        
-        if is_palin:
-            print(f"Result: '{text}' is a Palindrome ✓")
+        with metrics.stage('render'):
+            print(f"Original input: '{text}'")
+            print(f"Cleaned text: '{cleaned}'")
             
-            # Show different encouragement based on count (max 5)
-            if palindrome_count < len(encouragement_messages):
-                print(encouragement_messages[palindrome_count])
+            if is_palin:
+                print(f"Result: '{text}' is a Palindrome ✓")
+                
+                # Show different encouragement based on count (max 5)
+                if palindrome_count < len(encouragement_messages):
+                    print(encouragement_messages[palindrome_count])
+                else:
+                    # After 5, show a repeating message
+                    print("🌟 Another palindrome! You're absolutely incredible! 🎉\n")
             else:
-                # After 5, show a repeating message
-                print("🌟 Another palindrome! You're absolutely incredible! 🎉\n")
-            
-            return {'input': text, 'cleaned': cleaned, 'result': 'Palindrome'}
-        else:
-            print(f"Result: '{text}' is Not a palindrome ✗\n")
-            return {'input': text, 'cleaned': cleaned, 'result': 'Not palindrome'}
+                print(f"Result: '{text}' is Not a palindrome ✗\n")
+        
+        return {'input': text, 'cleaned': cleaned, 'result': 'Palindrome' if is_palin else 'Not palindrome'}
             
     except Exception as e:
+        metrics.error(e)
         print(f"Error: {e}\n")
         return None
 
-def main():
-    """Main loop to check palindromes until user exits."""
+def main(metrics=DISABLED):
+    """Main loop to check palindromes until user exits; metrics times each check."""
     print("=" * 50)
     print("Palindrome Checker")
     print("=" * 50)
@@ -146,7 +157,7 @@ def main():
                     continue
                 
                 # Check if palindrome
-                result_obj = check_and_display(user_input, palindrome_count, encouragement_messages)
+                result_obj = check_and_display(user_input, palindrome_count, encouragement_messages, metrics)
                 
                 # Add to history only if check was successful
                 if result_obj:
@@ -154,6 +165,7 @@ def main():
                     # Increment counter if it was a palindrome
                     if result_obj['result'] == 'Palindrome':
                         palindrome_count += 1
+                metrics.tick()
                     
             except KeyboardInterrupt:
                 print("\n\nProgram interrupted by user. Exiting...")
@@ -162,10 +174,12 @@ def main():
                 print("\n\nEnd of input detected. Exiting...")
                 break
             except Exception as e:
+                metrics.error(e)
                 print(f"Unexpected error in main loop: {e}")
                 print("Continuing...\n")
     
     finally:
+        metrics.close()
         # Show final summary
         print("\n" + "=" * 50)
         print(f"Total checks performed: {len(history)}")
@@ -177,9 +191,25 @@ def main():
         print("=" * 50)
         print("Thank you for using Palindrome Checker!")
 
-if __name__ == "__main__":
+def _parser(argparse):
+    parser = argparse.ArgumentParser(description="Minimal interactive palindrome checker.")
+    parser.add_argument('--metrics', metavar='PATH',
+                        help="write stage timings and counters to PATH (Prometheus text if it ends in .prom, else JSON)")
+    parser.add_argument('--metrics-every', type=float, default=10.0, metavar='SECONDS',
+                        help="how often to rewrite the metrics file (default 10)")
+    return parser
+
+def cli(argv=None):
+    """Command-line entry point, also used by first.py."""
+    args = parse_options(argv, _parser)
+    metrics = DISABLED
+    if args:
+        metrics = metrics_for(args.metrics, 'palindrome', args.metrics_every)
     try:
-        main()
+        main(metrics)
     except Exception as e:
         print(f"Fatal error: {e}")
-        print("Program terminated.")
\ No newline at end of file
+        print("Program terminated.")
+
+if __name__ == "__main__":
+    cli()
\ No newline at end of file
@@ -0,0 +1,260 @@
+import random
+
+from battleship_engine import HIT, MISS, SUNK
+
+try:
+    import numpy as np
+except ImportError:  # everything still works, just without vectorized maths
+    np = None
+
+# Extra weight for a placement per unsunk hit it covers; large enough that
+# finishing a wounded ship always beats hunting for a new one
+HIT_WEIGHT = 50
+# Extra weight for a placement per cell inside a radar window that found metal
+RADAR_WEIGHT = 2
+
+def _bits_to_rows(bits, rows, cols):
+    """Unpack a bitset into a list of rows of 0/1 ints."""
+    digits = bin(bits)[:1:-1].ljust(rows * cols, '0')
+    return [[1 if d == '1' else 0 for d in digits[r * cols:(r + 1) * cols]] for r in range(rows)]
+
+def _bits_to_array(bits, rows, cols):
+    size = rows * cols
+    raw = np.frombuffer(bits.to_bytes((size + 7) // 8, 'little'), dtype=np.uint8)
+    return np.unpackbits(raw, bitorder='little')[:size].reshape(rows, cols)
+
+def _line_density(blocked, hits, hot, length):
+    """Pure-Python density along one line: for every cell, the total weight of
+    the placements of `length` that cover it (a 1-D window sum done twice)."""
+    n = len(blocked)
+    if length > n:
+        return [0] * n
+    pb, ph, pr = [0], [0], [0]
+    for b, h, r in zip(blocked, hits, hot):
+        pb.append(pb[-1] + b)
+        ph.append(ph[-1] + h)
+        pr.append(pr[-1] + r)
+    prefix = [0]
+    for start in range(n - length + 1):
+        end = start + length
+        weight = 0
+        if pb[end] == pb[start]:
+            weight = 1 + HIT_WEIGHT * (ph[end] - ph[start]) + RADAR_WEIGHT * (pr[end] - pr[start])
+        prefix.append(prefix[-1] + weight)
+    last = n - length
+    return [prefix[min(c, last) + 1] - prefix[max(0, c - length + 1)] for c in range(n)]
+
+def _axis_density(layers, lengths):
+    """NumPy density along axis 1 of every row at once.
+
+    `layers` stacks the blocked grid and the per-cell bonus (hits and radar
+    contacts, already weighted); `lengths` maps ship length -> how many such
+    ships remain. Window sums of both grids come from one shared prefix
+    sum, and spreading each placement's weight back over its cells is a
+    second window sum, so everything is slicing.
+    """
+    _, rows, cols = layers.shape
+    prefix = np.zeros((2, rows, cols + 1), dtype=np.int32)
+    np.cumsum(layers, axis=2, out=prefix[:, :, 1:])
+    total = np.zeros((rows, cols), dtype=np.int32)
+    for length, count in lengths.items():
+        if length > cols:
+            continue
+        blocked, bonus = prefix[:, :, length:] - prefix[:, :, :-length]
+        weight = (blocked == 0) * (count * (1 + bonus))
+        # spread[:, length + s] = weight of placements starting at or before s
+        spread = np.zeros((rows, cols + length), dtype=np.int32)
+        np.cumsum(weight, axis=1, out=spread[:, length:cols + 1])
+        spread[:, cols + 1:] = spread[:, cols:cols + 1]
+        total += spread[:, length:] - spread[:, :-length]
+    return total
+
+def radar_sums(grid, radius):
+    """Return, for every cell, the sum of `grid` over the square of `radius` around it.
+
+    `grid` is a 2-D NumPy array (for example ship cells as 0/1); the window is
+    clipped at the edges. Uses a 2-D prefix sum, so any radius costs the same.
+    """
+    rows, cols = grid.shape
+    s = np.zeros((rows + 1, cols + 1), dtype=np.int64)
+    s[1:, 1:] = grid.cumsum(0).cumsum(1)
+    r0 = np.clip(np.arange(rows) - radius, 0, rows)
+    r1 = np.clip(np.arange(rows) + radius + 1, 0, rows)
+    c0 = np.clip(np.arange(cols) - radius, 0, cols)
+    c1 = np.clip(np.arange(cols) + radius + 1, 0, cols)
+    return s[r1][:, c1] - s[r0][:, c1] - s[r1][:, c0] + s[r0][:, c0]
+
+class Shooter:
+    """Base class for computer players: next_shot() picks a cell, record() learns the result.
+
+    Shooters only see what a player would: their own hits and misses, which
+    ships were sunk (and where), and radar answers.
+    """
+
+    def __init__(self, rows, cols, fleet, rng=None):
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        self.remaining = sorted(fleet)  # lengths of ships not yet sunk
+        self.rng = rng or random.Random()
+        self.hits = 0
+        self.misses = 0
+        self.sunk = 0
+
+    def _unshot(self):
+        shot = self.hits | self.misses
+        return [i for i in range(self.size) if not shot >> i & 1]
+
+    def record(self, row, col, result, sunk_mask=0):
+        """Learn the result of a shot; sunk_mask is the sunk ship's cells on SUNK."""
+        bit = 1 << (row * self.cols + col)
+        if result == MISS:
+            self.misses |= bit
+            return
+        self.hits |= bit
+        if result == SUNK:
+            self.sunk |= sunk_mask
+            length = bin(sunk_mask).count('1')
+            if length in self.remaining:
+                self.remaining.remove(length)
+
+    def next_shot(self):
+        raise NotImplementedError
+
+class RandomShooter(Shooter):
+    def next_shot(self):
+        return divmod(self.rng.choice(self._unshot()), self.cols)
+
+class HuntTargetShooter(Shooter):
+    """Hunt on a checkerboard until a hit, then work through its neighbours."""
+
+    def __init__(self, rows, cols, fleet, rng=None):
+        super().__init__(rows, cols, fleet, rng)
+        self.targets = []
+
+    def record(self, row, col, result, sunk_mask=0):
+        super().record(row, col, result, sunk_mask)
+        if result == HIT:
+            for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                r, c = row + dr, col + dc
+                if 0 <= r < self.rows and 0 <= c < self.cols:
+                    self.targets.append((r, c))
+
+    def next_shot(self):
+        shot = self.hits | self.misses
+        while self.targets:
+            row, col = self.targets.pop()
+            if not shot >> (row * self.cols + col) & 1:
+                return row, col
+        cells = self._unshot()
+        parity = [i for i in cells if (i // self.cols + i % self.cols) % 2 == 0]
+        return divmod(self.rng.choice(parity or cells), self.cols)
+
+class ProbabilityShooter(Shooter):
+    """Fire at the cell covered by the most weighted ship placements.
+
+    Every remaining ship length is slid across and down the board; a
+    placement counts if it avoids misses, sunk ships and radar-cleared
+    cells, and weighs more the more unsunk hits (and radar contacts) it
+    covers. With NumPy the whole map is a few prefix-sum array operations;
+    without it the same window sums run line by line in Python.
+    """
+
+    def __init__(self, rows, cols, fleet, rng=None, use_numpy=True):
+        super().__init__(rows, cols, fleet, rng)
+        self.cleared = 0  # cells a radar scan proved empty
+        self.hot = 0      # cells inside radar windows that found metal
+        self.use_numpy = use_numpy and np is not None
+
+    def observe_radar(self, window_mask, count):
+        """Learn a radar answer: how many ship cells lie under window_mask."""
+        if count == 0:
+            self.cleared |= window_mask
+        else:
+            self.hot |= window_mask & ~(self.hits | self.misses)
+
+    def density(self):
+        """Return the density map as rows of numbers (a NumPy array when available)."""
+        blocked = self.misses | self.sunk | self.cleared
+        open_hits = self.hits & ~self.sunk
+        counts = {}
+        for length in self.remaining:
+            counts[length] = counts.get(length, 0) + 1
+        if self.use_numpy:
+            grids = _bits_to_array(blocked | open_hits << self.size | self.hot << 2 * self.size,
+                                   3 * self.rows, self.cols).reshape(3, self.rows, self.cols)
+            layers = np.empty((2, self.rows, self.cols), dtype=np.int32)
+            layers[0] = grids[0]
+            layers[1] = HIT_WEIGHT * grids[1] + RADAR_WEIGHT * grids[2]
+            total = _axis_density(layers, counts)
+            down = {length: count for length, count in counts.items() if length > 1}
+            if down:
+                total += _axis_density(np.ascontiguousarray(layers.transpose(0, 2, 1)), down).T
+            total[_bits_to_array(self.hits | self.misses, self.rows, self.cols) == 1] = -1
+            return total
+
+        b = _bits_to_rows(blocked, self.rows, self.cols)
+        h = _bits_to_rows(open_hits, self.rows, self.cols)
+        r = _bits_to_rows(self.hot, self.rows, self.cols)
+        total = [[0] * self.cols for _ in range(self.rows)]
+        columns = [list(col) for col in zip(*b)], [list(col) for col in zip(*h)], [list(col) for col in zip(*r)]
+        for length, count in counts.items():
+            for row in range(self.rows):
+                for col, value in enumerate(_line_density(b[row], h[row], r[row], length)):
+                    total[row][col] += count * value
+            if length > 1:
+                for col in range(self.cols):
+                    line = _line_density(columns[0][col], columns[1][col], columns[2][col], length)
+                    for row, value in enumerate(line):
+                        total[row][col] += count * value
+        shot = self.hits | self.misses
+        for i in range(self.size):
+            if shot >> i & 1:
+                total[i // self.cols][i % self.cols] = -1
+        return total
+
+    def next_shot(self):
+        total = self.density()
+        if self.use_numpy:
+            return divmod(int(np.argmax(total)), self.cols)
+        best = max(range(self.size), key=lambda i: total[i // self.cols][i % self.cols])
+        return divmod(best, self.cols)
+
+    def next_scan(self, radius=1):
+        """Pick a radar centre: the window covering the most placement weight.
+
+        None while a hit ship is still afloat, since finishing it is better
+        use of the turn. Without NumPy the densest cell is the centre.
+        """
+        if self.hits & ~self.sunk:
+            return None
+        total = self.density()
+        if self.use_numpy:
+            return divmod(int(np.argmax(radar_sums(np.maximum(total, 0), radius))), self.cols)
+        best = max(range(self.size), key=lambda i: total[i // self.cols][i % self.cols])
+        return divmod(best, self.cols)
+
+SHOOTERS = {'random': RandomShooter, 'hunt-target': HuntTargetShooter, 'probability': ProbabilityShooter}
+
+def play(engine, shooter, radars=0, radius=1):
+    """Let a shooter play a BattleshipEngine to the end; return the number of shots.
+
+    Shooters with next_scan() may also spend up to `radars` radar scans,
+    which don't count as shots.
+    """
+    scan = getattr(shooter, 'next_scan', None)
+    while not engine.is_over():
+        if radars and scan is not None:
+            center = scan(radius)
+            if center is not None:
+                radars -= 1
+                row, col = center
+                shooter.observe_radar(engine.window_mask(row, col, radius), engine.radar(row, col, radius))
+                continue
+        row, col = shooter.next_shot()
+        result = engine.shoot(row, col)
+        sunk_mask = 0
+        if result == SUNK:
+            sunk_mask = engine.ship_masks[engine.ship_at[row * engine.cols + col]]
+        shooter.record(row, col, result, sunk_mask)
+    return engine.shots
@@ -0,0 +1,148 @@
+import random
+
+DEFAULT_FLEET = (5, 4, 3, 3, 2)
+MAX_SIZE = 100
+
+MISS, HIT, SUNK = 'miss', 'hit', 'sunk'
+
+def _select_bit(bits, index):
+    """Return the position of the index-th set bit of bits (0-based, from bit 0)."""
+    digits = bin(bits)[:1:-1]  # least significant bit first
+    low, high = 0, len(digits)
+    # Smallest prefix that holds index + 1 set bits; str.count keeps each step in C
+    while low < high:
+        mid = (low + high) // 2
+        if digits.count('1', 0, mid + 1) > index:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+class BattleshipEngine:
+    """A rows x cols Battleship game with a whole fleet, stored as integer bitsets.
+
+    Cell (row, col) is bit row * cols + col of every bitset, so a hit test is
+    one AND, a sunk check is one AND per ship, and a radar scan ANDs a window
+    mask with the ship bits. A game is a handful of ints plus a small dict,
+    so tens of thousands fit in memory at once.
+    """
+
+    __slots__ = ('rows', 'cols', 'fleet', 'ship_masks', 'ship_at', 'ships', 'hits', 'misses',
+                 'sunk', 'shots', '_rng')
+
+    def __init__(self, rows=10, cols=10, fleet=DEFAULT_FLEET, rng=None):
+        if not (1 <= rows <= MAX_SIZE and 1 <= cols <= MAX_SIZE):
+            raise ValueError(f"Board size must be between 1x1 and {MAX_SIZE}x{MAX_SIZE}")
+        if any(not 1 <= length <= max(rows, cols) for length in fleet):
+            raise ValueError("Every ship must fit on the board")
+        self.rows = rows
+        self.cols = cols
+        self.fleet = tuple(fleet)
+        self._rng = rng or random
+        self.ship_masks = []   # one bitset per ship, in fleet order
+        self.ship_at = {}      # cell index -> ship number
+        self.ships = 0         # every ship cell
+        self.hits = 0
+        self.misses = 0
+        self.sunk = 0          # cells of ships that have been sunk
+        self.shots = 0
+        self._place_fleet()
+
+    # -- placement -----------------------------------------------------
+
+    def _starts(self, free, length, step, limit_mask):
+        """Bitset of cells where a ship of `length` fits, extending by `step` bits per cell."""
+        starts = free & limit_mask
+        for i in range(1, length):
+            starts &= free >> (i * step)
+        return starts
+
+    def _place_fleet(self):
+        all_cells = (1 << (self.rows * self.cols)) - 1
+        # Biggest ships first, so the crowded end of placement has the most room
+        for number, length in sorted(enumerate(self.fleet), key=lambda item: -item[1]):
+            free = all_cells & ~self.ships
+            # Start cells that leave room to the right / below for this length
+            across_limit = 0
+            row_starts = (1 << max(0, self.cols - length + 1)) - 1
+            for row in range(self.rows):
+                across_limit |= row_starts << (row * self.cols)
+            down_limit = (1 << (max(0, self.rows - length + 1) * self.cols)) - 1
+            across = self._starts(free, length, 1, across_limit)
+            down = self._starts(free, length, self.cols, down_limit) if length > 1 else 0
+            n_across, n_down = bin(across).count('1'), bin(down).count('1')
+            if not n_across + n_down:
+                raise ValueError("The fleet doesn't fit on this board")
+            # Pick uniformly among every legal placement, with no retries
+            pick = self._rng.randrange(n_across + n_down)
+            if pick < n_across:
+                start, step = _select_bit(across, pick), 1
+            else:
+                start, step = _select_bit(down, pick - n_across), self.cols
+            mask = 0
+            for i in range(length):
+                mask |= 1 << (start + i * step)
+                self.ship_at[start + i * step] = number
+            self.ships |= mask
+            self.ship_masks.append((number, mask))
+        self.ship_masks = [mask for _, mask in sorted(self.ship_masks)]
+
+    # -- play ----------------------------------------------------------
+
+    def index(self, row, col):
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise ValueError(f"({row}, {col}) is off the board")
+        return row * self.cols + col
+
+    def shoot(self, row, col):
+        """Fire at (row, col) and return MISS, HIT or SUNK."""
+        cell = self.index(row, col)
+        bit = 1 << cell
+        if (self.hits | self.misses) & bit:
+            raise ValueError(f"Already fired at ({row}, {col})")
+        self.shots += 1
+        if not self.ships & bit:
+            self.misses |= bit
+            return MISS
+        self.hits |= bit
+        mask = self.ship_masks[self.ship_at[cell]]
+        if mask & self.hits == mask:
+            self.sunk |= mask
+            return SUNK
+        return HIT
+
+    def is_over(self):
+        return self.hits & self.ships == self.ships
+
+    def ships_left(self):
+        return sum(1 for mask in self.ship_masks if mask & self.hits != mask)
+
+    def window_mask(self, row, col, radius):
+        """Bitset of the square of cells within `radius` of (row, col), clipped to the board."""
+        first_col, last_col = max(0, col - radius), min(self.cols - 1, col + radius)
+        row_bits = ((1 << (last_col - first_col + 1)) - 1) << first_col
+        mask = 0
+        for r in range(max(0, row - radius), min(self.rows - 1, row + radius) + 1):
+            mask |= row_bits << (r * self.cols)
+        return mask
+
+    def radar(self, row, col, radius=1):
+        """Return how many ship cells lie within `radius` of (row, col)."""
+        self.index(row, col)
+        return bin(self.ships & self.window_mask(row, col, radius)).count('1')
+
+    def cell_state(self, row, col, reveal=False):
+        """Return 'X' (hit), 'O' (miss), 'S' (ship, only with reveal) or '_'."""
+        bit = 1 << self.index(row, col)
+        if self.hits & bit:
+            return 'X'
+        if self.misses & bit:
+            return 'O'
+        if reveal and self.ships & bit:
+            return 'S'
+        return '_'
+
+    def render(self, reveal=False):
+        """Return the board as text, one line per row."""
+        return "\n".join(' '.join(self.cell_state(r, c, reveal) for c in range(self.cols))
+                         for r in range(self.rows))
@@ -0,0 +1,62 @@
+"""Shots-to-win and time per move of the Battleship shooters.
+
+Run from the repository root:  python benchmarks/bench_battleship_ai.py [GAMES]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import battleship_ai
+from battleship_ai import SHOOTERS, ProbabilityShooter, play
+from battleship_engine import BattleshipEngine, DEFAULT_FLEET
+
+# Radar scans given to the probability shooter in the extra row
+RADARS = 2
+
+def shots_to_win(name, games, seed=1, radars=0):
+    rng = random.Random(seed)
+    total = 0
+    start = time.perf_counter()
+    for _ in range(games):
+        engine = BattleshipEngine(rng=rng)
+        total += play(engine, SHOOTERS[name](engine.rows, engine.cols, engine.fleet, rng=rng), radars)
+    return total / games, time.perf_counter() - start
+
+def move_time(size, moves, use_numpy, seed=1):
+    """Average seconds per next_shot() on a size x size board, part way through a game."""
+    rng = random.Random(seed)
+    fleet = DEFAULT_FLEET * (size // 10)
+    engine = BattleshipEngine(size, size, fleet, rng=rng)
+    shooter = ProbabilityShooter(size, size, fleet, rng=rng, use_numpy=use_numpy)
+    elapsed = 0.0
+    for _ in range(moves):
+        start = time.perf_counter()
+        row, col = shooter.next_shot()
+        elapsed += time.perf_counter() - start
+        result = engine.shoot(row, col)
+        sunk = engine.ship_masks[engine.ship_at[row * size + col]] if result == 'sunk' else 0
+        shooter.record(row, col, result, sunk)
+    return elapsed / moves
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    print(f"{games} games on 10x10, fleet {DEFAULT_FLEET}, NumPy {'on' if battleship_ai.np else 'off'}")
+    print(f"{'shooter':>12} {'avg shots':>10} {'seconds':>9}")
+    for name in SHOOTERS:
+        average, elapsed = shots_to_win(name, games)
+        print(f"{name:>12} {average:>10.1f} {elapsed:>9.2f}")
+    average, elapsed = shots_to_win('probability', games, radars=RADARS)
+    print(f"{'+' + str(RADARS) + ' radars':>12} {average:>10.1f} {elapsed:>9.2f}")
+
+    print(f"\n{'board':>8} {'backend':>8} {'ms/move':>9}")
+    for size in (10, 50, 100):
+        backends = [True, False] if battleship_ai.np else [False]
+        for use_numpy in backends:
+            per_move = move_time(size, 50, use_numpy)
+            print(f"{size}x{size:<4} {'numpy' if use_numpy else 'python':>8} {per_move * 1000:>9.3f}")
+
+if __name__ == "__main__":
+    main()
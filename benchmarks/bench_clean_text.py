@@ -0,0 +1,41 @@
+"""Compare the translate-table normalizer with the original clean_text generator.
+
+Run from the repository root:  python benchmarks/bench_clean_text.py
+"""
+import os
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from normalizer import get_normalizer
+
+def legacy_clean_text(text):
+    """The per-character generator clean_text used before the normalizer."""
+    return ''.join(char.lower() for char in text
+                   if char not in string.punctuation and char != ' ')
+
+INPUTS = {
+    'short ascii': "A man, a plan, a canal: Panama!",
+    'short unicode': "Ésope reste ici et se repose — ΟΔΟΣ",
+    '4 MB ascii': "Was it a car or a cat I saw? " * 150_000,
+    '4 MB unicode': "Ça, c'est l'été à Noël; ΟΔΟΣ… " * 140_000,
+}
+
+def bench(func, text):
+    """Return the best per-call time in seconds."""
+    number = 20_000 if len(text) < 1000 else 3
+    return min(timeit.repeat(lambda: func(text), number=number, repeat=5)) / number
+
+def main():
+    normalizer = get_normalizer()
+    print(f"{'input':<16} {'generator':>12} {'translate':>12} {'speedup':>9}")
+    for name, text in INPUTS.items():
+        assert normalizer.clean(text) == legacy_clean_text(text), name
+        old = bench(legacy_clean_text, text)
+        new = bench(normalizer.clean, text)
+        print(f"{name:<16} {old * 1e6:>10.1f}us {new * 1e6:>10.1f}us {old / new:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
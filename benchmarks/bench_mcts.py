@@ -0,0 +1,74 @@
+"""Strength versus thinking time of the MCTS player, against a random player.
+
+Run from the repository root:
+
+    python benchmarks/bench_mcts.py                              # 5x5, four in a row
+    python benchmarks/bench_mcts.py --size 7 --k 4 --budget 10 50 100 -j 1 4
+
+For every budget (milliseconds per move) and worker count it plays
+--games games, MCTS taking X in half of them, and reports the playout
+rate, the time actually spent per move and the win/draw/loss rates.
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gomoku_engine import GomokuBoard
+from ttt_mcts import MCTSPlayer
+
+def play(player, size, k, mcts_mark, rng):
+    """Play one game of MCTS against uniformly random moves; return the result and MCTS move count."""
+    board = GomokuBoard(size, k)
+    mark, moves = "X", 0
+    while board.result is None:
+        if mark == mcts_mark:
+            square = player.choose_move(board, mark)
+            moves += 1
+        else:
+            square = rng.choice(board.empty)
+        board.play(square, mark)
+        mark = "O" if mark == "X" else "X"
+    return board.result, moves
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MCTS playouts/sec and win rate against random play.")
+    parser.add_argument('--size', type=int, default=5)
+    parser.add_argument('--k', type=int, default=4, help="marks in a row to win")
+    parser.add_argument('--budget', type=float, nargs='+', default=[5, 20, 50], metavar='MS',
+                        help="thinking time per move, in milliseconds")
+    parser.add_argument('-j', '--workers', type=int, nargs='+', default=[1], help="worker process counts to try")
+    parser.add_argument('--games', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{args.size}x{args.size}, {args.k} in a row, {args.games} games per row against random play")
+    print(f"{'budget':>8} {'workers':>7} {'playouts/s':>11} {'ms/move':>8} {'win':>6} {'draw':>6} {'loss':>6}")
+    for workers in args.workers:
+        for budget in args.budget:
+            player = MCTSPlayer(budget / 1000, workers, seed=args.seed)
+            rng = random.Random(args.seed)
+            won = drawn = lost = moves = 0
+            try:
+                for game in range(args.games):
+                    mark = "X" if game % 2 == 0 else "O"
+                    result, count = play(player, args.size, args.k, mark, rng)
+                    moves += count
+                    if result == mark:
+                        won += 1
+                    elif result == "Tie":
+                        drawn += 1
+                    else:
+                        lost += 1
+            finally:
+                player.close()
+            rate = player.playouts / player.seconds if player.seconds else 0.0
+            per_move = player.seconds / moves * 1000 if moves else 0.0
+            print(f"{budget:>6g}ms {workers:>7} {rate:>11,.0f} {per_move:>8.1f} "
+                  f"{won / args.games:>6.0%} {drawn / args.games:>6.0%} {lost / args.games:>6.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
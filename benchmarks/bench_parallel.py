@@ -0,0 +1,47 @@
+"""Speedup curve of the process-pool palindrome batch over worker counts.
+
+Run from the repository root:  python benchmarks/bench_parallel.py [LINES]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from palindrome_batch import check_lines
+from palindrome_parallel import check_lines_parallel
+
+PHRASES = [
+    "A man, a plan, a canal: Panama",
+    "Was it a car or a cat I saw?",
+    "The quick brown fox jumps over the lazy dog",
+    "Never odd or even",
+    "12321",
+    "Madam, in Eden, I'm Adam",
+]
+
+def corpus(count):
+    return ((i, PHRASES[i % len(PHRASES)]) for i in range(count))
+
+def timed(records):
+    start = time.perf_counter()
+    count = sum(1 for _ in records)
+    return count, time.perf_counter() - start
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, 16, cpus} & set(range(1, cpus + 1))) or [1]
+
+    _, base = timed(check_lines(corpus(count)))
+    print(f"{count} lines, {cpus} CPUs")
+    print(f"{'workers':>7} {'seconds':>9} {'lines/sec':>12} {'speedup':>8}")
+    print(f"{'serial':>7} {base:>9.2f} {count / base:>12,.0f} {1.0:>7.2f}x")
+    for workers in worker_counts:
+        if workers == 1:
+            continue
+        _, elapsed = timed(check_lines_parallel(corpus(count), workers, chunk_size=5000))
+        print(f"{workers:>7} {elapsed:>9.2f} {count / elapsed:>12,.0f} {base / elapsed:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Startup cost of each first.py command, measured with `python -X importtime`.
+
+Run from the repository root:  python benchmarks/bench_startup.py [--budget MS] [--runs N]
+
+For each command this imports the tool's module the way first.py does
+and adds up the import time of every module a bare interpreter doesn't
+already load. The median over the runs is checked against the budget and
+the script exits with status 1 if any command goes over.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from first import COMMANDS
+
+def _env():
+    env = dict(os.environ)
+    # Measure the usual case, with compiled bytecode cached on disk
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+def import_times(code):
+    """Run `code` under -X importtime; return {module: self time in microseconds} and wall seconds."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, env=_env(),
+                            capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(self_us)
+    return times, wall
+
+def measure(command, baseline, runs):
+    """Median extra import time (ms), median wall time (ms) and the slowest modules."""
+    code = f"import first; first.load({command!r})"
+    import_times(code)  # warm the bytecode cache
+    totals, walls, modules = [], [], {}
+    for _ in range(runs):
+        times, wall = import_times(code)
+        extra = {name: us for name, us in times.items() if name not in baseline}
+        totals.append(sum(extra.values()) / 1000)
+        walls.append(wall * 1000)
+        for name, us in extra.items():
+            modules.setdefault(name, []).append(us)
+    slowest = sorted(((statistics.median(v) / 1000, name) for name, v in modules.items()), reverse=True)[:3]
+    return statistics.median(totals), statistics.median(walls), slowest
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget', type=float, default=8.0, help="import time allowed per command, in ms")
+    parser.add_argument('--runs', type=int, default=15)
+    args = parser.parse_args()
+
+    baseline, _ = import_times('pass')
+    walls = [import_times('pass')[1] * 1000 for _ in range(args.runs)]
+    print(f"bare interpreter: {statistics.median(walls):.1f} ms wall")
+    print(f"{'command':>16} {'imports ms':>11} {'wall ms':>8}  slowest modules")
+    over = []
+    for command in COMMANDS:
+        imports, wall, slowest = measure(command, baseline, args.runs)
+        flag = ' OVER BUDGET' if imports > args.budget else ''
+        names = ', '.join(f"{name} {ms:.1f}" for ms, name in slowest)
+        print(f"{command:>16} {imports:>11.2f} {wall:>8.1f}  {names}{flag}")
+        if flag:
+            over.append(command)
+    if over:
+        print(f"Over the {args.budget:g} ms budget: {', '.join(over)}")
+        return 1
+    print(f"All commands within the {args.budget:g} ms budget")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+"""Benchmarks for every hot path, with JSON baselines to catch regressions.
+
+Run from the repository root:
+
+    python benchmarks/bench_suite.py                        # run everything
+    python benchmarks/bench_suite.py -k palindrome --quick  # a subset, smaller inputs
+    python benchmarks/bench_suite.py --save base.json       # record a baseline
+    python benchmarks/bench_suite.py --compare base.json    # exit 1 on regressions
+
+Output and pauses are stubbed out while a case runs (prints go nowhere,
+time.sleep returns at once, Battleship runs in fast mode), so the numbers
+are the compute cost only. Each case reports the best of several repeats.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import exe_mine
+import palindrome_bulk
+from Battleship import ProfessionalBattleship
+from history_store import HistoryStore
+from palindrome_stats import StatsAccumulator
+from ttt_engine import Board, check_winner
+from ttt_selfplay import RandomPolicy, play_games
+
+MB = 1 << 20
+
+class _Null:
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+NULL = _Null()
+
+@contextmanager
+def quiet():
+    """Send prints to nowhere and make time.sleep a no-op."""
+    sleep = time.sleep
+    time.sleep = lambda seconds: None
+    try:
+        with redirect_stdout(NULL):
+            yield
+    finally:
+        time.sleep = sleep
+
+def long_palindrome(size):
+    half = ("Was it a car or a cat I saw? " * (size // 58 + 1))[:size // 2]
+    return half + half[::-1]
+
+# -- cases: each returns the function to time, built from its inputs -------
+
+def case_clean_text(text):
+    return lambda: exe_mine.clean_text(text)
+
+def case_is_palindrome(text):
+    return lambda: exe_mine.is_palindrome(text)
+
+def case_check_and_display(text):
+    messages = ["Nice!"] * 5
+
+    def run():
+        exe_mine.check_and_display(text, 0, messages, StatsAccumulator())
+    return run
+
+def short_phrases(count):
+    rng = random.Random(1)
+    phrases = ["A man, a plan, a canal: Panama", "hello world", "Racecar", "No lemon, no melon", "12345"]
+    return [rng.choice(phrases) + str(i % 7) * (i % 2) for i in range(count)]
+
+def case_classify_each(texts):
+    def run():
+        for text in texts:
+            try:
+                exe_mine.classify_text(text)
+            except ValueError:
+                pass
+    return run
+
+def case_classify_many(texts):
+    return lambda: palindrome_bulk.classify_many(texts)
+
+def case_check_winner(count):
+    # Every position reachable in real play, cycled up to `count` boards
+    boards, seen, stack = [], set(), [Board()]
+    while stack:
+        board = stack.pop()
+        if (board.x, board.o) in seen:
+            continue
+        seen.add((board.x, board.o))
+        boards.append(board)
+        if check_winner(board) is None:
+            mark = "X" if bin(board.x).count('1') == bin(board.o).count('1') else "O"
+            for square in board.available_moves():
+                child = board.copy()
+                child[square] = mark
+                stack.append(child)
+    boards = (boards * (count // len(boards) + 1))[:count]
+
+    def run():
+        for board in boards:
+            check_winner(board)
+    return run
+
+def case_selfplay(games):
+    policy = RandomPolicy()
+    return lambda: play_games(games, policy, policy, seed=1)
+
+def case_radar(scans):
+    game = ProfessionalBattleship(fast=True, out=NULL, seed=1)
+    targets = [random.Random(1).randrange(game.size) for _ in range(scans)]
+
+    def run():
+        for target in targets:
+            game.radar_uses = 1
+            game.use_radar(target)
+        del game.actions[:]
+    return run
+
+def case_fire_missile(games):
+    def run():
+        rng = random.Random(1)
+        for seed in range(games):
+            game = ProfessionalBattleship(fast=True, out=NULL, seed=seed)
+            targets = list(range(game.size))
+            rng.shuffle(targets)
+            while not game.is_over():
+                game.fire_missile(targets.pop())
+    return run
+
+def case_history(records):
+    record = {'input': "A man, a plan, a canal: Panama", 'cleaned': "amanaplanacanalpanama",
+              'result': 'Palindrome', 'timestamp': "12:00:00"}
+
+    def run():
+        with tempfile.TemporaryDirectory() as folder:
+            history = HistoryStore(os.path.join(folder, 'history.jsonl'))
+            for _ in range(records):
+                history.append(record)
+            for number in range(1, history.page_count() + 1, max(1, history.page_count() // 50)):
+                history.page(number)
+            exe_mine.print_table_history(history, 1)
+            history.close()
+    return run
+
+def case_stats(records):
+    rng = random.Random(1)
+    texts = ["".join(rng.choice("abcde") for _ in range(rng.randint(3, 40))) for _ in range(1000)]
+
+    def run():
+        stats = StatsAccumulator()
+        for i in range(records):
+            text = texts[i % len(texts)]
+            stats.add(text, text, text == text[::-1])
+        for p in (50, 95, 99):
+            stats.percentile(p)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'stats.json')
+            stats.save(path)
+            StatsAccumulator.load(path)
+        exe_mine.print_statistics(stats)
+    return run
+
+def _count(n):
+    """Short label for a count: 1e6 for powers of ten, 12,345 otherwise."""
+    text = str(n)
+    return f"1e{len(text) - 1}" if text.strip('0') == '1' else f"{n:,}"
+
+def _bytes(n):
+    return f"{n // MB}MB" if n % MB == 0 else f"{n // 1024}KB"
+
+def cases(quick):
+    """(name, function factory, argument); --quick shrinks the big inputs tenfold.
+
+    Names state the input sizes actually used, so quick and full results
+    never share a name.
+    """
+    big = 10 if quick else 1
+    phrase, nonsense = "A man, a plan, a canal: Panama", "The quick brown fox jumps over the lazy dog"
+    text_size = MB // big
+    big_text = long_palindrome(text_size)
+    # Non-palindromes take the hint path (Manacher + prefix function), so keep them smaller
+    nonsense_size = MB // 16 // big
+    long_nonsense = (nonsense * (nonsense_size // len(nonsense) + 1))[:nonsense_size]
+    phrase_count = 10 ** 5 // big
+    phrases = short_phrases(phrase_count)
+    boards, games, scans = 10 ** 6 // big, 10 ** 6 // big, 10 ** 5 // big
+    shots, records = 10 ** 4 // big, 10 ** 5 // big
+    return [
+        ('clean_text short', case_clean_text, phrase),
+        (f'clean_text {_bytes(text_size)}', case_clean_text, big_text),
+        ('is_palindrome short', case_is_palindrome, phrase),
+        (f'is_palindrome {_bytes(text_size)} palindrome', case_is_palindrome, big_text),
+        (f'is_palindrome {_bytes(text_size)} mismatch', case_is_palindrome, "x" + big_text),
+        ('check_and_display palindrome', case_check_and_display, phrase),
+        ('check_and_display not palindrome', case_check_and_display, nonsense),
+        (f'check_and_display {_bytes(text_size)} palindrome', case_check_and_display, big_text),
+        (f'check_and_display {_bytes(nonsense_size)} not palindrome', case_check_and_display, long_nonsense),
+        (f'classify_text {_count(phrase_count)} short phrases', case_classify_each, phrases),
+        (f'classify_many {_count(phrase_count)} short phrases', case_classify_many, phrases),
+        (f'check_winner {_count(boards)} boards', case_check_winner, boards),
+        (f'selfplay random {_count(games)} games', case_selfplay, games),
+        (f'battleship use_radar {_count(scans)}', case_radar, scans),
+        (f'battleship fire_missile {_count(shots)} games', case_fire_missile, shots),
+        (f'history append+page {_count(records)}', case_history, records),
+        (f'stats add+save {_count(records)}', case_stats, records),
+    ]
+
+def measure(func, repeat, min_time=0.2):
+    """Best seconds per call: calls are batched until a batch takes min_time."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+def _format(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the project's hot paths.")
+    parser.add_argument('-k', metavar='TEXT', help="only run cases whose name contains TEXT")
+    parser.add_argument('--quick', action='store_true', help="inputs a tenth of the size")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--save', metavar='JSON', help="write the results as a baseline")
+    parser.add_argument('--compare', metavar='JSON', help="compare with a saved baseline")
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help="slowdown ratio that counts as a regression (default 1.2)")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('quick') != args.quick:
+            print("warning: baseline was recorded with a different --quick setting", file=sys.stderr)
+        baseline = baseline['results']
+
+    results, regressions = {}, []
+    for name, factory, argument in cases(args.quick):
+        if args.k and args.k.lower() not in name.lower():
+            continue
+        func = factory(argument)
+        with quiet():
+            seconds = measure(func, args.repeat)
+        results[name] = seconds
+        line = f"{name:<36} {_format(seconds):>12}"
+        if baseline and name in baseline:
+            ratio = seconds / baseline[name]
+            line += f"  {ratio:>5.2f}x baseline"
+            if ratio > args.threshold:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'python': platform.python_version(), 'machine': platform.machine(),
+                       'quick': args.quick, 'results': results}, f, indent=2)
+        print(f"Saved {len(results)} results to {args.save}")
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:g}x: {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,13 @@
-import string
 import time
-import json
-from datetime import datetime
+
+from first import parse_options
+from history_store import HistoryStore
+from instrumentation import DISABLED, metrics_for
+from normalizer import DIGITS_ONLY, EMPTY_TEXT, NO_LETTERS, NOTHING_LEFT, get_normalizer
+from palindrome_analysis import count_palindromes, longest_palindrome, manacher, shortest_completion, to_original_span
+from palindrome_approx import apply_edits, describe_edits, palindrome_edits, substitution_edits
+from palindrome_stats import StatsAccumulator
+from result_cache import ResultCache
 
 # ANSI color codes for terminal
 class Colors:
@@ -41,14 +47,16 @@ def loading_animation(text="Checking"):
         time.sleep(0.3)
     print("\r" + " " * 50 + "\r", end='')  # Clear the line
 
+# Compiled translate tables for the classic clean_text rules
+_normalizer = get_normalizer()
+
 def clean_text(text):
     """Remove spaces, punctuation and convert to lowercase."""
     try:
         if not isinstance(text, str):
             raise TypeError("Input must be a string")
         
-        cleaned = ''.join(char.lower() for char in text 
-                         if char not in string.punctuation and char != ' ')
+        cleaned = _normalizer.clean(text)
         return cleaned
     except TypeError as e:
         print(f"{Colors.RED}Error: {e}{Colors.END}")
@@ -57,24 +65,54 @@ def clean_text(text):
         print(f"{Colors.RED}Unexpected error in clean_text: {e}{Colors.END}")
         return ""
 
+def classify_text(text):
+    """Validate and clean text, returning (cleaned, is_palindrome).
+
+    Raises ValueError with a user-facing message when the text can't be
+    checked, so callers decide how to report it.
+    """
+    if not text:
+        raise ValueError(EMPTY_TEXT)
+    
+    if text.strip().isdigit():
+        raise ValueError(DIGITS_ONLY)
+    
+    cleaned = clean_text(text)
+    
+    if not cleaned:
+        raise ValueError(NOTHING_LEFT)
+    
+    if not any(c.isalpha() for c in cleaned):
+        raise ValueError(NO_LETTERS)
+    
+    return cleaned, cleaned == cleaned[::-1]
+
+def check_text(text):
+    """Return whether text is a palindrome, without building the cleaned string.
+
+    Same rules and errors as classify_text, but the comparison walks inward
+    from both ends and stops at the first mismatch.
+    """
+    if not text:
+        raise ValueError(EMPTY_TEXT)
+    
+    if text.strip().isdigit():
+        raise ValueError(DIGITS_ONLY)
+    
+    has_letter = _normalizer.letter_state(text)
+    
+    if has_letter is None:
+        raise ValueError(NOTHING_LEFT)
+    
+    if not has_letter:
+        raise ValueError(NO_LETTERS)
+    
+    return _normalizer.is_mirrored(text)
+
 def is_palindrome(text):
     """Check if the cleaned text is a palindrome."""
     try:
-        if not text:
-            raise ValueError("Cannot check empty text")
-        
-        if text.strip().isdigit():
-            raise ValueError("Numbers are not allowed. Please enter text with letters.")
-        
-        cleaned = clean_text(text)
-        
-        if not cleaned:
-            raise ValueError("No valid characters to check after cleaning")
-        
-        if not any(c.isalpha() for c in cleaned):
-            raise ValueError("Input must contain at least one letter")
-        
-        return cleaned == cleaned[::-1]
+        return check_text(text)
     except ValueError as e:
         print(f"{Colors.RED}Error: {e}{Colors.END}")
         return False
@@ -82,128 +120,193 @@ def is_palindrome(text):
         print(f"{Colors.RED}Unexpected error in is_palindrome: {e}{Colors.END}")
         return False
 
-def get_palindrome_hint(text, cleaned):
-    """Suggest how to make it a palindrome."""
-    if len(cleaned) <= 2:
-        return f"{Colors.YELLOW}💡 Hint: Try adding '{cleaned[::-1]}' at the end!{Colors.END}"
-    return f"{Colors.YELLOW}💡 Hint: To make it palindrome, you could try: '{cleaned + cleaned[::-1]}'{Colors.END}"
+# The hint offers in-place edits when this many or fewer make a palindrome
+HINT_MAX_EDITS = 3
+
+def get_palindrome_hint(text, cleaned, longest, count, max_edits=HINT_MAX_EDITS):
+    """Suggest the fewest characters to append to make it a palindrome,
+    and the fewest in-place edits when there are at most max_edits.
 
-def check_and_display(text, palindrome_count, encouragement_messages, stats):
+    longest is the (start, end) span from longest_palindrome(cleaned) and
+    count is count_palindromes(cleaned).
+    """
+    addition = shortest_completion(cleaned)
+    hint = f"{Colors.YELLOW}💡 Hint: Try adding '{addition}' at the end: '{cleaned + addition}'{Colors.END}"
+    edits = palindrome_edits(cleaned, max_edits)
+    if edits:
+        hint += (f"\n{Colors.YELLOW}✏️  Nearly there — {len(edits)} edit{'s' if len(edits) > 1 else ''} away: "
+                 f"{describe_edits(edits)} → '{apply_edits(cleaned, edits)}'")
+        # The replacement count is only shown when it's larger but still
+        # within max_edits, which needs a deletion among the edits
+        if len(edits) < max_edits and any(edit[0] == 'delete' for edit in edits):
+            substitutions = substitution_edits(cleaned, max_edits)
+            if substitutions is not None and len(substitutions) > len(edits):
+                hint += f" (or {len(substitutions)} replacements)"
+        hint += Colors.END
+    start, end = longest
+    if end - start > 1:
+        hint += f"\n{Colors.YELLOW}🔎 Longest palindrome inside: '{cleaned[start:end]}'"
+        try:
+            first, last = to_original_span(text, start, end, _normalizer)
+            hint += f" ('{text[first:last]}' at {first}-{last - 1} of your input)"
+        except ValueError:
+            pass  # offsets aren't known through NFKD
+        hint += f", one of {count} palindromic substrings{Colors.END}"
+    return hint
+
+def check_and_display(text, palindrome_count, encouragement_messages, stats, cache=None, metrics=DISABLED):
     """Check palindrome and display original, cleaned text, and result."""
     try:
-        if not text:
-            raise ValueError("Cannot check empty text")
-        
-        if text.strip().isdigit():
-            print(f"{Colors.RED}Error: Numbers are not allowed. Please enter text with letters.{Colors.END}\n")
-            return None
-        
-        cleaned = clean_text(text)
-        
-        if not cleaned:
-            print(f"{Colors.RED}Error: No valid characters to check after cleaning{Colors.END}\n")
-            return None
-        
-        if not any(c.isalpha() for c in cleaned):
-            print(f"{Colors.RED}Error: Input must contain at least one letter{Colors.END}\n")
+        try:
+            with metrics.stage('check'):
+                if cache is not None:
+                    hits = cache.hits
+                    cleaned, is_palin = cache.classify(text, classify_text)
+                    metrics.count('cache_hits' if cache.hits > hits else 'cache_misses')
+                else:
+                    cleaned, is_palin = classify_text(text)
+        except ValueError as e:
+            metrics.count('rejected')
+            print(f"{Colors.RED}Error: {e}{Colors.END}\n")
             return None
         
         # Show loading animation
         loading_animation("Checking")
         
-        # Check palindrome
-        is_palin = cleaned == cleaned[::-1]
-        
         # Display results with colors
-        print(f"{Colors.CYAN}Original input: {Colors.BOLD}'{text}'{Colors.END}")
-        print(f"{Colors.CYAN}Cleaned text: {Colors.BOLD}'{cleaned}'{Colors.END}")
+        with metrics.stage('render'):
+            print(f"{Colors.CYAN}Original input: {Colors.BOLD}'{text}'{Colors.END}")
+            print(f"{Colors.CYAN}Cleaned text: {Colors.BOLD}'{cleaned}'{Colors.END}")
         
         if is_palin:
-            print(f"{Colors.GREEN}{Colors.BOLD}Result: '{text}' is a Palindrome ✓{Colors.END}")
+            metrics.count('checks', result='palindrome')
+            with metrics.stage('render'):
+                print(f"{Colors.GREEN}{Colors.BOLD}Result: '{text}' is a Palindrome ✓{Colors.END}")
             
             # Update stats
-            stats['longest'] = max(stats.get('longest', ''), cleaned, key=len)
-            stats['shortest'] = min(stats.get('shortest', cleaned), cleaned, key=len) if stats.get('shortest') else cleaned
+            stats.add(text, cleaned, True)
             
             # Show different encouragement based on count
-            if palindrome_count < len(encouragement_messages):
-                print(f"{Colors.GREEN}{encouragement_messages[palindrome_count]}{Colors.END}")
-            else:
-                print(f"{Colors.GREEN}🌟 Another palindrome! You're absolutely incredible! 🎉{Colors.END}\n")
+            with metrics.stage('render'):
+                if palindrome_count < len(encouragement_messages):
+                    print(f"{Colors.GREEN}{encouragement_messages[palindrome_count]}{Colors.END}")
+                else:
+                    print(f"{Colors.GREEN}🌟 Another palindrome! You're absolutely incredible! 🎉{Colors.END}\n")
             
-            return {'input': text, 'cleaned': cleaned, 'result': 'Palindrome', 'timestamp': datetime.now().strftime("%H:%M:%S")}
+            return {'input': text, 'cleaned': cleaned, 'result': 'Palindrome', 'timestamp': time.strftime("%H:%M:%S")}
         else:
-            print(f"{Colors.RED}{Colors.BOLD}Result: '{text}' is Not a palindrome ✗{Colors.END}")
-            print(get_palindrome_hint(text, cleaned))
-            print()
-            return {'input': text, 'cleaned': cleaned, 'result': 'Not palindrome', 'timestamp': datetime.now().strftime("%H:%M:%S")}
+            metrics.count('checks', result='not_palindrome')
+            with metrics.stage('hint'):
+                radii = manacher(cleaned)
+                start, end = longest_palindrome(cleaned, radii)
+                hint = get_palindrome_hint(text, cleaned, (start, end), count_palindromes(cleaned, radii))
+            with metrics.stage('render'):
+                print(f"{Colors.RED}{Colors.BOLD}Result: '{text}' is Not a palindrome ✗{Colors.END}")
+                print(hint)
+                print()
+            
+            # Update stats
+            stats.add(text, cleaned, False)
+            stats.add_inside(cleaned[start:end])
+            
+            return {'input': text, 'cleaned': cleaned, 'result': 'Not palindrome', 'timestamp': time.strftime("%H:%M:%S")}
             
     except Exception as e:
+        metrics.error(e)
         print(f"{Colors.RED}Error: {e}{Colors.END}\n")
         return None
 
-def print_table_history(history):
-    """Print history in a nice table format."""
+def print_table_history(history, page=None, page_size=20):
+    """Print one page of history in a nice table format (the latest page by default)."""
     if not history:
         print(f"{Colors.YELLOW}No checks yet.{Colors.END}\n")
         return
     
+    pages = history.page_count(page_size)
+    page = pages if page is None else min(max(page, 1), pages)
+    
     print(f"\n{Colors.CYAN}{Colors.BOLD}{'='*90}")
     print(f"{'#':<4} {'Time':<10} {'Original':<25} {'Cleaned':<25} {'Result':<15}")
     print(f"{'='*90}{Colors.END}")
     
-    for i, record in enumerate(history, 1):
+    for i, record in history.page(page, page_size):
         result_color = Colors.GREEN if record['result'] == 'Palindrome' else Colors.RED
         print(f"{Colors.BOLD}{i:<4}{Colors.END} {record['timestamp']:<10} {record['input']:<25} {record['cleaned']:<25} {result_color}{record['result']:<15}{Colors.END}")
     
-    print(f"{Colors.CYAN}{Colors.BOLD}{'='*90}{Colors.END}\n")
+    print(f"{Colors.CYAN}{Colors.BOLD}{'='*90}{Colors.END}")
+    print(f"{Colors.CYAN}Page {page}/{pages} — type 'history <page>' for another page{Colors.END}\n")
 
 def save_history_to_file(history):
-    """Save history to a JSON file."""
+    """Make sure every check so far is safely on disk."""
     try:
-        filename = f"palindrome_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
-        print(f"{Colors.GREEN}✅ History saved to {filename}{Colors.END}\n")
+        history.sync()
+        print(f"{Colors.GREEN}✅ History saved to {history.path}{Colors.END}\n")
     except Exception as e:
         print(f"{Colors.RED}Error saving file: {e}{Colors.END}\n")
 
-def print_statistics(history, palindrome_count, stats):
+def print_statistics(stats, cache=None):
     """Print detailed statistics."""
-    if not history:
+    if not stats.total:
         return
     
-    total = len(history)
-    success_rate = (palindrome_count / total * 100) if total > 0 else 0
-    
     print(f"\n{Colors.CYAN}{Colors.BOLD}📊 STATISTICS 📊{Colors.END}")
     print(f"{Colors.CYAN}{'='*50}{Colors.END}")
-    print(f"{Colors.BOLD}Total checks:{Colors.END} {total}")
-    print(f"{Colors.GREEN}{Colors.BOLD}Palindromes found:{Colors.END} {palindrome_count} 🎯")
-    print(f"{Colors.RED}{Colors.BOLD}Not palindromes:{Colors.END} {total - palindrome_count}")
-    print(f"{Colors.YELLOW}{Colors.BOLD}Success rate:{Colors.END} {success_rate:.1f}%")
+    print(f"{Colors.BOLD}Total checks:{Colors.END} {stats.total}")
+    print(f"{Colors.GREEN}{Colors.BOLD}Palindromes found:{Colors.END} {stats.palindromes} 🎯")
+    print(f"{Colors.RED}{Colors.BOLD}Not palindromes:{Colors.END} {stats.not_palindromes}")
+    print(f"{Colors.YELLOW}{Colors.BOLD}Success rate:{Colors.END} {stats.success_rate:.1f}%")
+    print(f"{Colors.BOLD}Input length:{Colors.END} min {stats.min_length}, P50 {stats.percentile(50)}, "
+          f"P95 {stats.percentile(95)}, max {stats.max_length}")
     
-    if stats.get('longest'):
-        print(f"{Colors.BLUE}{Colors.BOLD}Longest palindrome:{Colors.END} '{stats['longest']}' ({len(stats['longest'])} chars)")
-    if stats.get('shortest'):
-        print(f"{Colors.BLUE}{Colors.BOLD}Shortest palindrome:{Colors.END} '{stats['shortest']}' ({len(stats['shortest'])} chars)")
+    if stats.longest:
+        print(f"{Colors.BLUE}{Colors.BOLD}Longest palindrome:{Colors.END} '{stats.longest}' ({len(stats.longest)} chars)")
+    if stats.shortest:
+        print(f"{Colors.BLUE}{Colors.BOLD}Shortest palindrome:{Colors.END} '{stats.shortest}' ({len(stats.shortest)} chars)")
+    if stats.longest_inside:
+        print(f"{Colors.BLUE}{Colors.BOLD}Longest palindrome inside other input:{Colors.END} '{stats.longest_inside}' ({len(stats.longest_inside)} chars)")
+    if cache is not None and cache.hits + cache.misses:
+        print(f"{Colors.BOLD}Result cache:{Colors.END} {cache.hits} hits, {cache.misses} misses "
+              f"({cache.hit_rate:.1f}% hit rate), {cache.evictions} evictions")
     
     print(f"{Colors.CYAN}{'='*50}{Colors.END}\n")
 
-def main():
-    """Main loop to check palindromes until user exits."""
-    print_logo()
+def main(history_path=None, logo=True, metrics=DISABLED):
+    """Main loop to check palindromes until user exits.
+
+    Checks are logged to history_path as they happen; pass the log of an
+    earlier session to continue it. logo=False skips the banner, and
+    metrics (see instrumentation.py) times each stage of every check.
+    """
+    if logo:
+        print_logo()
     
     print(f"{Colors.YELLOW}{Colors.BOLD}Commands:{Colors.END}")
     print(f"  • Type {Colors.GREEN}'exit'{Colors.END} or {Colors.GREEN}'quit'{Colors.END} to stop")
-    print(f"  • Type {Colors.BLUE}'history'{Colors.END} to see all checks")
+    print(f"  • Type {Colors.BLUE}'history'{Colors.END} to see recent checks ({Colors.BLUE}'history 2'{Colors.END} for page 2)")
     print(f"  • Type {Colors.BLUE}'stats'{Colors.END} to see statistics")
     print(f"  • Type {Colors.BLUE}'save'{Colors.END} to save history to file")
     print(f"  • Type {Colors.BLUE}'clear'{Colors.END} to clear history\n")
     
-    history = []
-    palindrome_count = 0
-    stats = {}
+    with metrics.stage('io'):
+        history = HistoryStore(history_path or f"palindrome_history_{time.strftime('%Y%m%d_%H%M%S')}.jsonl")
+    stats_path = history.path + '.stats.json'
+    stats = StatsAccumulator()
+    # Repeated phrases (in any case or punctuation) skip the re-check
+    cache = ResultCache(normalized=True)
+    
+    if history:
+        saved = StatsAccumulator.load(stats_path)
+        if saved is not None and saved.total == len(history):
+            stats = saved
+        else:
+            # No up-to-date snapshot: rebuild it from the log once
+            for record in history:
+                is_palin = record['result'] == 'Palindrome'
+                stats.add(record['input'], record['cleaned'], is_palin)
+                if not is_palin:
+                    start, end = longest_palindrome(record['cleaned'])
+                    stats.add_inside(record['cleaned'][start:end])
+        print(f"{Colors.GREEN}✅ Resumed {len(history)} checks from {history.path}{Colors.END}\n")
     
     encouragement_messages = [
         "🎉 Awesome! You found a palindrome! 🌟\n💪 Keep it up, you're doing great! 🚀\n",
@@ -222,35 +325,45 @@ def main():
                     print(f"\n{Colors.CYAN}Goodbye! 👋{Colors.END}")
                     break
                 
-                if user_input.lower() == 'history':
-                    print_table_history(history)
+                command = user_input.lower().split()
+                if command and command[0] == 'history' and len(command) <= 2:
+                    if len(command) == 2 and not command[1].isdigit():
+                        print(f"{Colors.YELLOW}Usage: history [page number]{Colors.END}\n")
+                    else:
+                        print_table_history(history, int(command[1]) if len(command) == 2 else None)
                     continue
                 
                 if user_input.lower() == 'stats':
-                    print_statistics(history, palindrome_count, stats)
+                    print_statistics(stats, cache)
                     continue
                 
                 if user_input.lower() == 'save':
-                    save_history_to_file(history)
+                    with metrics.stage('io'):
+                        save_history_to_file(history)
+                        stats.save(stats_path)
                     continue
                 
                 if user_input.lower() == 'clear':
-                    history.clear()
-                    palindrome_count = 0
-                    stats.clear()
-                    print(f"{Colors.GREEN}✅ History cleared!{Colors.END}\n")
+                    with metrics.stage('io'):
+                        rotated = history.clear()
+                        stats.reset()
+                        stats.save(stats_path)
+                    print(f"{Colors.GREEN}✅ History cleared!{Colors.END}")
+                    if rotated:
+                        print(f"{Colors.BLUE}Earlier checks were kept in {rotated}{Colors.END}")
+                    print()
                     continue
                 
                 if not user_input.strip():
                     print(f"{Colors.YELLOW}Warning: Empty input. Please enter some text.{Colors.END}\n")
                     continue
                 
-                result_obj = check_and_display(user_input, palindrome_count, encouragement_messages, stats)
+                result_obj = check_and_display(user_input, stats.palindromes, encouragement_messages, stats, cache, metrics)
                 
                 if result_obj:
-                    history.append(result_obj)
-                    if result_obj['result'] == 'Palindrome':
-                        palindrome_count += 1
+                    with metrics.stage('io'):
+                        history.append(result_obj)
+                metrics.tick()
                         
             except KeyboardInterrupt:
                 print(f"\n\n{Colors.YELLOW}Program interrupted by user. Exiting...{Colors.END}")
@@ -259,15 +372,20 @@ def main():
                 print(f"\n\n{Colors.YELLOW}End of input detected. Exiting...{Colors.END}")
                 break
             except Exception as e:
+                metrics.error(e)
                 print(f"{Colors.RED}Unexpected error in main loop: {e}{Colors.END}")
                 print(f"{Colors.YELLOW}Continuing...{Colors.END}\n")
     
     finally:
-        print_statistics(history, palindrome_count, stats)
+        history.close()
+        if history:
+            stats.save(stats_path)
+        metrics.close()
+        print_statistics(stats, cache)
         
         if history:
             print(f"{Colors.CYAN}{Colors.BOLD}Your checks:{Colors.END}")
-            for i, record in enumerate(history, 1):
+            for i, record in enumerate(history.tail, len(history) - len(history.tail) + 1):
                 result_color = Colors.GREEN if record['result'] == 'Palindrome' else Colors.RED
                 print(f"{i}. '{record['input']}' → cleaned: '{record['cleaned']}' → {result_color}{record['result']}{Colors.END}")
         
@@ -275,9 +393,28 @@ def main():
         print(f"Thank you for using Palindrome Checker! 🎉")
         print(f"{'='*50}{Colors.END}\n")
 
-if __name__ == "__main__":
+def _parser(argparse):
+    parser = argparse.ArgumentParser(description="Interactive palindrome checker.")
+    parser.add_argument('--resume', metavar='HISTORY_FILE', help="continue the history log of an earlier session")
+    parser.add_argument('--no-logo', action='store_true', help="start at the prompt without the banner")
+    parser.add_argument('--metrics', metavar='PATH',
+                        help="write stage timings and counters to PATH (Prometheus text if it ends in .prom, else JSON)")
+    parser.add_argument('--metrics-every', type=float, default=10.0, metavar='SECONDS',
+                        help="how often to rewrite the metrics file (default 10)")
+    return parser
+
+def cli(argv=None):
+    """Command-line entry point, also used by first.py."""
+    args = parse_options(argv, _parser)
+    history_path, logo, metrics = None, True, DISABLED
+    if args:
+        history_path, logo = args.resume, not args.no_logo
+        metrics = metrics_for(args.metrics, 'palindrome', args.metrics_every)
     try:
-        main()
+        main(history_path, logo, metrics)
     except Exception as e:
         print(f"{Colors.RED}Fatal error: {e}{Colors.END}")
-        print("Program terminated.")
\ No newline at end of file
+        print("Program terminated.")
+
+if __name__ == "__main__":
+    cli()
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""One launcher for every game and tool.
+
+    python first.py palindrome|palindrome-lite|palindrome-file|palindrome-index|battleship|tictactoe [options]
+
+Only the chosen tool's modules are imported, so a launch costs little
+more than starting Python itself; benchmarks/bench_startup.py keeps it
+that way. The rule for tools: a module that only some runs need (argparse
+and the re module under it, json for saved state) is imported inside the
+function that uses it, not at the top of the file. parse_options() below
+does this for command-line options.
+"""
+import sys
+
+# command -> (module with a cli(argv) function, description)
+COMMANDS = {
+    'palindrome': ('exe_mine', "interactive palindrome checker (--resume FILE, --no-logo)"),
+    'palindrome-lite': ('Palindrome_exe', "the minimal palindrome checker"),
+    'palindrome-file': ('palindrome_mmap', "check whole files, however large, without loading them"),
+    'palindrome-index': ('palindrome_index', "O(1) palindrome queries over spans of a text (--text FILE | --index PATH)"),
+    'battleship': ('Battleship', "Battleship: Deep Sea (--fast, --seed N, --record LOG)"),
+    'tictactoe': ('game', "Tic-Tac-Toe against the computer (--seed N, --record LOG, --size N for MCTS)"),
+}
+
+def parse_options(argv, build_parser, check=None):
+    """Parse a tool's options, or return None when it was given none.
+
+    argv defaults to sys.argv[1:]. build_parser(argparse) returns the
+    ArgumentParser; check(args, error), if given, validates the result and
+    calls error(message) to reject it.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        return None
+    import argparse
+    parser = build_parser(argparse)
+    args = parser.parse_args(argv)
+    if check is not None:
+        check(args, parser.error)
+    return args
+
+def usage():
+    lines = ["usage: first.py COMMAND [options]", "", "commands:"]
+    width = max(len(name) for name in COMMANDS)
+    lines.extend(f"  {name:<{width}}  {description}" for name, (_, description) in COMMANDS.items())
+    return "\n".join(lines)
+
+def load(command):
+    """Import and return the module behind a command."""
+    return __import__(COMMANDS[command][0])
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help'):
+        print(usage())
+        return 0 if argv else 2
+    if argv[0] not in COMMANDS:
+        print(f"first.py: unknown command {argv[0]!r}\n\n{usage()}", file=sys.stderr)
+        return 2
+    return load(argv[0]).cli(argv[1:])
+
+if __name__ == "__main__":
+    sys.exit(main())
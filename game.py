@@ -1,23 +1,15 @@
 import random
 
-def print_board(board):
-    print(f"\n {board[0]} | {board[1]} | {board[2]} ")
-    print("-----------")
-    print(f" {board[3]} | {board[4]} | {board[5]} ")
-    print("-----------")
-    print(f" {board[6]} | {board[7]} | {board[8]} \n")
+from first import parse_options
+from ttt_ai import DIFFICULTY, PerfectPlayer
+from ttt_engine import Board, check_winner, print_board
 
-def check_winner(board):
-    win_conditions = [(0,1,2), (3,4,5), (6,7,8), (0,3,6), (1,4,7), (2,5,8), (0,4,8), (2,4,6)]
-    for a, b, c in win_conditions:
-        if board[a] == board[b] == board[c] != " ":
-            return board[a]
-    if " " not in board:
-        return "Tie"
-    return None
-
-def main():
-    board = [" "] * 9
+def main(seed=None, record=None):
+    """Play one game; `seed` fixes the computer's choices, `record` is a move log to append to."""
+    board = Board()
+    if seed is None:
+        seed = random.randrange(1 << 32)
+    moves = []
     
     print("--- Welcome to Tic-Tac-Toe! ---")
     
@@ -27,6 +19,11 @@ def main():
         user_choice = input("Do you want to be X or O? ").upper()
     
     computer_choice = "O" if user_choice == "X" else "X"
+    
+    difficulty = ""
+    while difficulty not in DIFFICULTY:
+        difficulty = input(f"Difficulty ({'/'.join(DIFFICULTY)})? ").strip().lower() or "perfect"
+    computer = PerfectPlayer(difficulty, rng=random.Random(seed))
     current_turn = "X"  # X always starts
     
     print(f"You are {user_choice}. Computer is {computer_choice}.")
@@ -41,6 +38,9 @@ def main():
                 print("It's a draw!")
             else:
                 print(f"Winner is: {result}!")
+            if record:
+                from replay_log import append_records, tictactoe_record
+                append_records(record, [tictactoe_record(seed, user_choice, difficulty, moves, result)])
             break
 
         if current_turn == user_choice:
@@ -51,16 +51,98 @@ def main():
                     print("Taken! Try again.")
                     continue
                 board[move] = user_choice
+                moves.append(move % 9)  # Board accepts negative squares like a list
                 current_turn = computer_choice
             except (ValueError, IndexError):
                 print("Invalid input. Enter 0-8.")
         else:
-            # Computer Move (Random)
+            # Computer Move (solved table, mixed with random moves below 'perfect')
             print(f"Computer ({computer_choice}) is thinking...")
-            available_moves = [i for i, val in enumerate(board) if val == " "]
-            move = random.choice(available_moves)
+            move = computer.choose_move(board, computer_choice)
             board[move] = computer_choice
+            moves.append(move)
             current_turn = user_choice
 
+def play_large(size, k, budget=0.05, workers=1, seed=None):
+    """Play one game on a size x size board (k in a row wins) against the MCTS player."""
+    from gomoku_engine import GomokuBoard, print_board as print_large
+    from ttt_mcts import MCTSPlayer
+    board = GomokuBoard(size, k)
+    computer = MCTSPlayer(budget, workers, seed=seed)
+    
+    print(f"--- Welcome to {size}x{size} Tic-Tac-Toe, {k} in a row! ---")
+    
+    user_choice = ""
+    while user_choice not in ["X", "O"]:
+        user_choice = input("Do you want to be X or O? ").upper()
+    computer_choice = "O" if user_choice == "X" else "X"
+    current_turn = "X"
+    
+    print(f"You are {user_choice}. Computer is {computer_choice}, thinking {budget * 1000:g} ms a move.")
+    print("Enter a move as 'row col'.")
+    
+    try:
+        while board.result is None:
+            print_large(board)
+            if current_turn == user_choice:
+                try:
+                    row, col = map(int, input(f"Your turn ({user_choice}). Row and column: ").split())
+                    if not (0 <= row < size and 0 <= col < size):
+                        raise ValueError
+                    if board.cell(row, col) != " ":
+                        print("Taken! Try again.")
+                        continue
+                    board.play(row * size + col, user_choice)
+                except ValueError:
+                    print(f"Invalid input. Enter two numbers from 0 to {size - 1}.")
+                    continue
+            else:
+                print(f"Computer ({computer_choice}) is thinking...")
+                board.play(computer.choose_move(board, computer_choice), computer_choice)
+            current_turn = computer_choice if current_turn == user_choice else user_choice
+    finally:
+        computer.close()
+    
+    print_large(board)
+    print("It's a draw!" if board.result == "Tie" else f"Winner is: {board.result}!")
+
+def _parser(argparse):
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe against the computer.")
+    parser.add_argument('--seed', type=int, default=None, help="make the computer's choices repeatable")
+    parser.add_argument('--record', metavar='PATH', help="append the finished game to a move log")
+    parser.add_argument('--size', type=int, default=3, help="play on a bigger board against Monte Carlo search")
+    parser.add_argument('--k', type=int, help="marks in a row to win on a bigger board (default: the size, up to 5)")
+    parser.add_argument('--budget', type=float, metavar='MS', help="computer thinking time per move (default: 50)")
+    parser.add_argument('--workers', type=int, help="processes searching in parallel (default: 1)")
+    return parser
+
+def _check(args, error):
+    if args.size == 3:
+        for name in ('k', 'budget', 'workers'):
+            if getattr(args, name) is not None:
+                error(f"--{name} only applies to Monte Carlo games (--size other than 3)")
+        return
+    if args.record:
+        error("--record only covers 3x3 games")
+    if args.size < 2:
+        error("--size must be at least 2")
+    if args.k is not None and not 1 <= args.k <= args.size:
+        error(f"--k must be between 1 and the size ({args.size})")
+    if args.budget is not None and args.budget <= 0:
+        error("--budget must be positive")
+    if args.workers is not None and args.workers < 1:
+        error("--workers must be at least 1")
+
+def cli(argv=None):
+    """Command-line entry point, also used by first.py."""
+    args = parse_options(argv, _parser, _check)
+    seed, record = None, None
+    if args:
+        if args.size != 3:
+            return play_large(args.size, args.k or min(args.size, 5), (args.budget or 50) / 1000,
+                              args.workers or 1, args.seed)
+        seed, record = args.seed, args.record
+    main(seed, record)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    cli()
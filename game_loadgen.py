@@ -0,0 +1,115 @@
+import argparse
+import asyncio
+import random
+import time
+
+from game_server import GameServer
+
+PHRASES = ["A man, a plan, a canal: Panama", "Was it a car or a cat I saw?", "hello world", "Never odd or even"]
+
+async def _ask(reader, writer, command, latencies):
+    start = time.perf_counter()
+    writer.write(command.encode('utf-8') + b"\n")
+    reply = (await reader.readline()).decode('utf-8').rstrip('\n')
+    latencies.append(time.perf_counter() - start)
+    return reply
+
+async def _tictactoe(reader, writer, rng, latencies):
+    reply = await _ask(reader, writer, f"NEW ttt {rng.choice(['easy', 'medium', 'perfect'])}", latencies)
+    while reply.startswith('OK') and reply.endswith('your-move'):
+        cells = reply.split()[-2]
+        reply = await _ask(reader, writer, f"MOVE {rng.choice([i for i, c in enumerate(cells) if c == '.'])}", latencies)
+
+async def _battleship(reader, writer, rng, latencies):
+    reply = await _ask(reader, writer, "NEW battleship", latencies)
+    targets = list(range(15))
+    rng.shuffle(targets)
+    for target in targets:
+        if not reply.startswith('OK') or reply.endswith(('won', 'lost')):
+            break
+        reply = await _ask(reader, writer, f"FIRE {target}", latencies)
+
+async def _palindrome(reader, writer, rng, latencies):
+    await _ask(reader, writer, "NEW palindrome", latencies)
+    for _ in range(5):
+        await _ask(reader, writer, f"CHECK {rng.choice(PHRASES)}", latencies)
+
+SCENARIOS = [_tictactoe, _battleship, _palindrome]
+
+async def _session(host, port, rng, latencies, errors):
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+        await reader.readline()  # greeting
+        await rng.choice(SCENARIOS)(reader, writer, rng, latencies)
+        writer.write(b"QUIT\n")
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+    except (ConnectionError, OSError) as e:
+        errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+
+def _percentile(values, p):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+async def run_load(host, port, sessions, concurrency, seed=None):
+    """Play `sessions` scripted sessions, `concurrency` at a time; return a summary dict."""
+    rng = random.Random(seed)
+    latencies, errors = [], {}
+    limit = asyncio.Semaphore(concurrency)
+
+    async def one(session_rng):
+        async with limit:
+            await _session(host, port, session_rng, latencies, errors)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(random.Random(rng.random())) for _ in range(sessions)))
+    elapsed = time.perf_counter() - start
+    return {
+        'sessions': sessions,
+        'seconds': elapsed,
+        'sessions_per_sec': sessions / elapsed,
+        'commands': len(latencies),
+        'p50_ms': _percentile(latencies, 50) * 1000,
+        'p99_ms': _percentile(latencies, 99) * 1000,
+        'errors': errors,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the game server with scripted sessions.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7777)
+    parser.add_argument('--local', action='store_true', help="start a server in this process on a free port")
+    parser.add_argument('-n', '--sessions', type=int, default=2000)
+    parser.add_argument('-c', '--concurrency', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    async def run():
+        server = None
+        host, port = args.host, args.port
+        if args.local:
+            # Generous limits so the load generator measures latency, not throttling
+            server = await GameServer('127.0.0.1', 0, rate=1e6, burst=1e6).start()
+            host, port = server.host, server.port
+        try:
+            return await run_load(host, port, args.sessions, args.concurrency, args.seed)
+        finally:
+            if server is not None:
+                # Let the handlers of the last sessions finish closing
+                for _ in range(100):
+                    if not server.active:
+                        break
+                    await asyncio.sleep(0.01)
+                server.close()
+
+    summary = asyncio.run(run())
+    print(f"{summary['sessions']} sessions, {summary['commands']} commands in {summary['seconds']:.2f}s")
+    print(f"{summary['sessions_per_sec']:,.0f} sessions/sec, p50 {summary['p50_ms']:.2f} ms, p99 {summary['p99_ms']:.2f} ms")
+    if summary['errors']:
+        print(f"Errors: {summary['errors']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+import argparse
+import asyncio
+import time
+
+from Battleship import ProfessionalBattleship
+from exe_mine import classify_text
+from result_cache import ResultCache
+from ttt_ai import DIFFICULTY, PerfectPlayer, load_table
+from ttt_engine import Board, check_winner
+
+HELP = ("commands: NEW ttt [easy|medium|hard|perfect] [X|O] | NEW battleship | NEW palindrome | "
+        "MOVE <0-8> | FIRE <n> | RADAR <n> | CHECK <text> | BOARD | PING | QUIT")
+
+class ProtocolError(Exception):
+    """A bad command from the client; the message goes back as 'ERR <message>'."""
+
+class TokenBucket:
+    """Allow `rate` commands per second on average, with bursts of up to `burst`."""
+
+    __slots__ = ('rate', 'burst', 'tokens', 'stamp')
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.stamp = time.monotonic()
+
+    def allow(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+class TicTacToeGame:
+    def __init__(self, player, user_mark):
+        self.board = Board()
+        self.player = player
+        self.user = user_mark
+        self.computer = "O" if user_mark == "X" else "X"
+        if self.computer == "X":
+            self.board[player.choose_move(self.board, "X")] = "X"
+
+    def state(self):
+        cells = ''.join(mark if mark != " " else "." for mark in self.board)
+        result = check_winner(self.board)
+        return f"{cells} {result.lower() if result else 'your-move'}"
+
+    def move(self, square):
+        if check_winner(self.board):
+            raise ProtocolError("game over")
+        if not 0 <= square < 9 or self.board[square] != " ":
+            raise ProtocolError("invalid square")
+        self.board[square] = self.user
+        if not check_winner(self.board):
+            self.board[self.player.choose_move(self.board, self.computer)] = self.computer
+        return self.state()
+
+class BattleshipGame:
+    def __init__(self):
+        self.game = ProfessionalBattleship()
+
+    def state(self):
+        g = self.game
+        cells = ''.join("X" if i in g.hits else "O" if i in g.misses else "." for i in range(g.size))
+        if len(g.hits) == g.ship_size:
+            status = "won"
+        elif g.is_over():
+            status = "lost"
+        else:
+            status = f"missiles={g.max_missiles - len(g.misses)} radars={g.radar_uses}"
+        return f"{cells} {status}"
+
+    def _target(self, target):
+        g = self.game
+        if g.is_over():
+            raise ProtocolError("game over")
+        if not 0 <= target < g.size:
+            raise ProtocolError("invalid target")
+        return target
+
+    def fire(self, target):
+        target = self._target(target)
+        if target in self.game.hits or target in self.game.misses:
+            raise ProtocolError("already fired there")
+        hit = self.game.shoot(target)
+        return f"{'hit' if hit else 'miss'} {self.state()}"
+
+    def radar(self, target):
+        target = self._target(target)
+        if self.game.radar_uses <= 0:
+            raise ProtocolError("no radar uses left")
+        found = self.game.use_radar(target)
+        return f"{'metal' if found else 'clear'} {self.state()}"
+
+class Session:
+    """Per-connection state: the current game and the rate limiter."""
+
+    def __init__(self, server):
+        self.server = server
+        self.game = None
+        self.kind = None
+        self.bucket = TokenBucket(server.rate, server.burst)
+
+    def handle(self, line):
+        """Run one command line and return the reply (without the newline)."""
+        verb, _, rest = line.strip().partition(' ')
+        verb = verb.upper()
+        if verb == 'PING':
+            return 'OK PONG'
+        if verb == 'HELP':
+            return f'OK {HELP}'
+        if verb == 'NEW':
+            return 'OK ' + self.new_game(rest.split())
+        if verb == 'CHECK':
+            if self.kind != 'palindrome':
+                raise ProtocolError("start a palindrome session first")
+            try:
+                cleaned, is_palin = self.server.cache.classify(rest, classify_text)
+            except ValueError as e:
+                raise ProtocolError(str(e))
+            return f"OK {'palindrome' if is_palin else 'not-palindrome'} {cleaned}"
+        if verb in ('MOVE', 'FIRE', 'RADAR', 'BOARD'):
+            return 'OK ' + self.game_command(verb, rest)
+        raise ProtocolError(f"unknown command {verb!r}")
+
+    def new_game(self, args):
+        kind = args[0].lower() if args else ''
+        if kind == 'ttt':
+            difficulty = 'perfect'
+            mark = 'X'
+            for arg in args[1:]:
+                if arg.lower() in DIFFICULTY:
+                    difficulty = arg.lower()
+                elif arg.upper() in ('X', 'O'):
+                    mark = arg.upper()
+                else:
+                    raise ProtocolError(f"bad option {arg!r}")
+            self.game = TicTacToeGame(self.server.players[difficulty], mark)
+        elif kind == 'battleship':
+            self.game = BattleshipGame()
+        elif kind == 'palindrome':
+            self.game = None
+            self.kind = kind
+            return 'palindrome ready'
+        else:
+            raise ProtocolError("game must be ttt, battleship or palindrome")
+        self.kind = kind
+        return f"{kind} {self.game.state()}"
+
+    def game_command(self, verb, rest):
+        if self.game is None:
+            raise ProtocolError("no game in progress")
+        if verb == 'BOARD':
+            return self.game.state()
+        try:
+            target = int(rest)
+        except ValueError:
+            raise ProtocolError("expected a number")
+        if verb == 'MOVE' and self.kind == 'ttt':
+            return self.game.move(target)
+        if verb == 'FIRE' and self.kind == 'battleship':
+            return self.game.fire(target)
+        if verb == 'RADAR' and self.kind == 'battleship':
+            return self.game.radar(target)
+        raise ProtocolError(f"{verb} is not valid in {self.kind}")
+
+class GameServer:
+    """Line-based TCP server running every session in one asyncio loop.
+
+    Each connection gets its own Session. A connection that sends nothing for
+    `idle_timeout` seconds is closed, and each session may send `rate`
+    commands per second (bursts up to `burst`) before getting 'ERR rate limited'.
+    """
+
+    def __init__(self, host='127.0.0.1', port=7777, idle_timeout=300, rate=50, burst=100):
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.rate = rate
+        self.burst = burst
+        table = load_table()
+        # Players only read the shared table, so one per level serves every session
+        self.players = {level: PerfectPlayer(level, table) for level in DIFFICULTY}
+        self.cache = ResultCache(normalized=True)
+        self.active = 0
+        self.served = 0
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve, self.host, self.port, backlog=4096)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self):
+        if self._server is not None:
+            self._server.close()
+
+    async def _serve(self, reader, writer):
+        session = Session(self)
+        self.active += 1
+        self.served += 1
+        try:
+            writer.write(b"OK ready; HELP for commands\n")
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    writer.write(b"BYE idle\n")
+                    break
+                if not line:
+                    break
+                text = line.decode('utf-8', errors='replace')
+                if text.strip().upper() == 'QUIT':
+                    writer.write(b"BYE\n")
+                    break
+                if not session.bucket.allow():
+                    reply = 'ERR rate limited'
+                else:
+                    try:
+                        reply = session.handle(text)
+                    except ProtocolError as e:
+                        reply = f'ERR {e}'
+                writer.write(reply.encode('utf-8') + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            self.active -= 1
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve Tic-Tac-Toe, Battleship and the palindrome checker over TCP.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7777)
+    parser.add_argument('--idle-timeout', type=float, default=300, help="seconds before an idle session is closed")
+    parser.add_argument('--rate', type=float, default=50, help="commands per second allowed per session")
+    parser.add_argument('--burst', type=float, default=100, help="commands a session may send in a burst")
+    args = parser.parse_args(argv)
+
+    async def run():
+        server = await GameServer(args.host, args.port, args.idle_timeout, args.rate, args.burst).start()
+        print(f"Listening on {server.host}:{server.port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+class GomokuBoard:
+    """An N x N board where K marks in a row (any direction) win.
+
+    GomokuBoard(3, 3) is Tic-Tac-Toe; the default is 15x15 five-in-a-row.
+    Squares are numbered row by row from 0. Every play() only looks at the
+    lines through the square just played, and empty squares are tracked in
+    a swap-remove list, so a move costs O(K) however big the board is.
+    """
+
+    DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+    def __init__(self, size=15, k=5):
+        if not 1 <= k <= size:
+            raise ValueError("k must be between 1 and the board size")
+        self.size = size
+        self.k = k
+        self.cells = [" "] * (size * size)
+        self.empty = list(range(size * size))   # empty squares, in no particular order
+        self._slot = list(range(size * size))   # _slot[square] = its position in self.empty
+        self.result = None  # "X", "O", "Tie" or None while the game is on
+        self.moves = []
+
+    def __getitem__(self, square):
+        return self.cells[square]
+
+    def __len__(self):
+        return len(self.cells)
+
+    def cell(self, row, col):
+        return self.cells[row * self.size + col]
+
+    @property
+    def empty_count(self):
+        return len(self.empty)
+
+    def available_moves(self):
+        return sorted(self.empty)
+
+    def play(self, square, mark):
+        """Put mark on square and return the game result (None if still going)."""
+        if self.result is not None:
+            raise ValueError("The game is already over")
+        if self.cells[square] != " ":
+            raise ValueError(f"Square {square} is taken")
+        self.cells[square] = mark
+        # Swap-remove from the empty list
+        slot, last = self._slot[square], self.empty[-1]
+        self.empty[slot] = last
+        self._slot[last] = slot
+        self.empty.pop()
+        self.moves.append(square)
+
+        if self._wins_through(square, mark):
+            self.result = mark
+        elif not self.empty:
+            self.result = "Tie"
+        return self.result
+
+    def undo(self):
+        """Take back the last move."""
+        square = self.moves.pop()
+        self.cells[square] = " "
+        self._slot[square] = len(self.empty)
+        self.empty.append(square)
+        self.result = None
+
+    def _wins_through(self, square, mark):
+        size, cells, k = self.size, self.cells, self.k
+        row, col = divmod(square, size)
+        for dr, dc in self.DIRECTIONS:
+            run = 1
+            for sign in (1, -1):
+                r, c = row + sign * dr, col + sign * dc
+                while run < k and 0 <= r < size and 0 <= c < size and cells[r * size + c] == mark:
+                    run += 1
+                    r += sign * dr
+                    c += sign * dc
+            if run >= k:
+                return True
+        return False
+
+    def copy(self):
+        other = GomokuBoard.__new__(GomokuBoard)
+        other.size, other.k, other.result = self.size, self.k, self.result
+        other.cells = self.cells[:]
+        other.empty = self.empty[:]
+        other._slot = self._slot[:]
+        other.moves = self.moves[:]
+        return other
+
+def check_winner(board):
+    """Return "X" or "O" for a winner, "Tie" for a full board, else None."""
+    return board.result
+
+def print_board(board):
+    width = len(str(board.size - 1))
+    print("\n" + " " * (width + 1) + " ".join(f"{c:>{width}}" for c in range(board.size)))
+    for row in range(board.size):
+        marks = " ".join(f"{board.cell(row, c):>{width}}" for c in range(board.size))
+        print(f"{row:>{width}} {marks}")
+    print()
@@ -0,0 +1,179 @@
+import os
+from collections import deque
+
+class HistoryStore:
+    """Append-only JSON-lines history log with a bounded in-memory tail.
+
+    Each record is written as one line the moment it's added; the file is
+    fsynced every `sync_every` records (and on sync()/close()) instead of
+    being rewritten. Only the last `tail_size` records stay in memory;
+    older pages are read back from disk on demand.
+    """
+
+    INDEX_STEP = 1024  # lines between entries of the sparse offset index
+
+    def __init__(self, path, tail_size=200, sync_every=50):
+        self.path = path
+        self.tail = deque(maxlen=tail_size)
+        self.sync_every = sync_every
+        self._file = None
+        self._unsynced = 0
+        self._count = 0
+        self._index = None  # byte offsets of lines 0, INDEX_STEP, 2*INDEX_STEP, ...
+        if os.path.exists(path):
+            self._load()
+
+    def _load(self):
+        """Count existing records and read the tail by seeking back from the end."""
+        with open(self.path, 'rb') as f:
+            while True:
+                block = f.read(1 << 20)
+                if not block:
+                    break
+                self._count += block.count(b'\n')
+                last = block[-1:]
+            size = f.tell()
+            if size and last != b'\n':
+                size = self._drop_partial(f, size)
+            wanted = self.tail.maxlen
+            if not wanted:
+                return
+            position, data = size, b''
+            while position > 0 and data.count(b'\n') <= wanted:
+                step = min(1 << 16, position)
+                position -= step
+                f.seek(position)
+                data = f.read(step) + data
+        import json
+        lines = data.split(b'\n')[:-1]
+        if position > 0:
+            lines = lines[1:]  # the first line may be cut in half
+        self.tail.extend(json.loads(line) for line in lines[-wanted:])
+
+    def _drop_partial(self, f, size):
+        """Truncate a last line cut short by a crash; return the new size.
+
+        Otherwise the next append would be glued onto it.
+        """
+        position = size
+        while position > 0:
+            step = min(1 << 16, position)
+            position -= step
+            f.seek(position)
+            newline = f.read(step).rfind(b'\n')
+            if newline >= 0:
+                position += newline + 1
+                break
+        os.truncate(self.path, position)
+        return position
+
+    def append(self, record):
+        """Write one record to the log and keep it in the in-memory tail."""
+        import json
+        if self._file is None:
+            self._file = open(self.path, 'ab')
+        line = json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n'
+        if self._index is not None and self._count % self.INDEX_STEP == 0:
+            self._index.append(self._file.tell())
+        self._file.write(line)
+        self._count += 1
+        self.tail.append(record)
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every:
+            self.sync()
+
+    def sync(self):
+        """Flush buffered records and fsync them to disk."""
+        if self._file is not None and self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        self.sync()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def clear(self):
+        """Start an empty log, keeping the old records in a rotated file.
+
+        The log is append-only, so nothing is deleted: the current file is
+        renamed to path.1 (or the first free path.N) and new records go to
+        a fresh file at path. Returns the rotated path, or None if there
+        was no file yet.
+        """
+        self.close()
+        rotated = None
+        if os.path.exists(self.path):
+            number = 1
+            while os.path.exists(f"{self.path}.{number}"):
+                number += 1
+            rotated = f"{self.path}.{number}"
+            os.replace(self.path, rotated)
+        self.tail.clear()
+        self._count = 0
+        self._index = None
+        return rotated
+
+    def __len__(self):
+        return self._count
+
+    def __bool__(self):
+        return self._count > 0
+
+    def page_count(self, page_size=20):
+        return max(1, -(-self._count // page_size))
+
+    def page(self, number, page_size=20):
+        """Return [(position, record), ...] for a 1-based page, oldest records first."""
+        start = (number - 1) * page_size
+        stop = min(start + page_size, self._count)
+        if start < 0 or start >= stop:
+            return []
+        tail_start = self._count - len(self.tail)
+        if start >= tail_start:
+            records = list(self.tail)[start - tail_start:stop - tail_start]
+            return list(enumerate(records, start + 1))
+        return list(enumerate(self._read(start, stop), start + 1))
+
+    def _read(self, start, stop):
+        """Read records [start, stop) from disk using the sparse offset index."""
+        import json
+        if self._file is not None:
+            self._file.flush()
+        if self._index is None:
+            self._build_index()
+        line_no = start - start % self.INDEX_STEP
+        records = []
+        with open(self.path, 'rb') as f:
+            f.seek(self._index[line_no // self.INDEX_STEP])
+            for line in f:
+                if line_no >= stop:
+                    break
+                if line_no >= start:
+                    records.append(json.loads(line))
+                line_no += 1
+        return records
+
+    def _build_index(self):
+        self._index = []
+        offset = 0
+        with open(self.path, 'rb') as f:
+            for line_no, line in enumerate(f):
+                if line_no % self.INDEX_STEP == 0:
+                    self._index.append(offset)
+                offset += len(line)
+
+    def __iter__(self):
+        """Stream every record from disk, oldest first."""
+        import json
+        if self._file is not None:
+            self._file.flush()
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # a record still being written, or cut short by a crash
+                yield json.loads(line)
@@ -0,0 +1,194 @@
+import os
+import sys
+import time
+
+# Upper bounds (seconds) of the stage-time histogram buckets
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+class _Timer:
+    __slots__ = ('metrics', 'name', 'start')
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+class _NoTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NO_TIMER = _NoTimer()
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(pairs):
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in pairs) + '}' if pairs else ''
+
+class Metrics:
+    """Per-stage timers and labelled counters for one session.
+
+        with metrics.stage('check'):
+            ...
+        metrics.count('games_played', result='won')
+        metrics.error(exc)
+
+    If `path` is set, tick() rewrites it every `every` seconds and close()
+    writes it a last time: Prometheus text format when the path ends in
+    '.prom', a JSON snapshot otherwise. A path that can't be written is
+    reported once on stderr and the periodic writes stop; the session
+    itself carries on.
+    """
+
+    enabled = True
+
+    def __init__(self, namespace='app', path=None, every=10.0):
+        self.namespace = namespace
+        self.path = path
+        self.every = every
+        self.started = time.time()
+        self.stages = {}    # name -> [count, total seconds, per-bucket counts]
+        self.counters = {}  # (name, ((label, value), ...)) -> value
+        self._written = time.monotonic()
+        self._failed = False
+
+    def stage(self, name):
+        """Context manager timing one run of a stage."""
+        return _Timer(self, name)
+
+    def observe(self, name, seconds):
+        entry = self.stages.get(name)
+        if entry is None:
+            entry = self.stages[name] = [0, 0.0, [0] * len(BUCKETS)]
+        entry[0] += 1
+        entry[1] += seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                entry[2][i] += 1
+                break
+
+    def count(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def error(self, exc):
+        """Count an exception under its type name."""
+        self.count('errors', type=type(exc).__name__)
+
+    def snapshot(self):
+        """Return everything recorded so far as a JSON-ready dict."""
+        return {
+            'namespace': self.namespace,
+            'started': self.started,
+            'time': time.time(),
+            'stages': {name: {'count': count, 'seconds': total,
+                              'mean_ms': total / count * 1000 if count else 0.0}
+                       for name, (count, total, _) in self.stages.items()},
+            'counters': [{'name': name, 'labels': dict(labels), 'value': value}
+                         for (name, labels), value in sorted(self.counters.items())],
+        }
+
+    def prometheus(self):
+        """Return the metrics in the Prometheus text exposition format."""
+        ns = self.namespace
+        lines = []
+        if self.stages:
+            lines.append(f"# HELP {ns}_stage_seconds Time spent in each stage.")
+            lines.append(f"# TYPE {ns}_stage_seconds histogram")
+            for name, (count, total, buckets) in sorted(self.stages.items()):
+                cumulative = 0
+                for bound, hits in zip(BUCKETS, buckets):
+                    cumulative += hits
+                    lines.append(f'{ns}_stage_seconds_bucket{{stage="{_escape(name)}",le="{bound}"}} {cumulative}')
+                lines.append(f'{ns}_stage_seconds_bucket{{stage="{_escape(name)}",le="+Inf"}} {count}')
+                lines.append(f'{ns}_stage_seconds_sum{{stage="{_escape(name)}"}} {total}')
+                lines.append(f'{ns}_stage_seconds_count{{stage="{_escape(name)}"}} {count}')
+        described = set()
+        for (name, labels), value in sorted(self.counters.items()):
+            if name not in described:
+                described.add(name)
+                lines.append(f"# TYPE {ns}_{name}_total counter")
+            lines.append(f"{ns}_{name}_total{_labels(labels)} {value}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path=None):
+        """Write the metrics to path (default self.path) atomically."""
+        path = path or self.path
+        if path.endswith('.prom'):
+            text = self.prometheus()
+        else:
+            import json
+            text = json.dumps(self.snapshot(), indent=2) + '\n'
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, path)
+        self._written = time.monotonic()
+
+    def _save(self):
+        try:
+            self.write()
+        except OSError as e:
+            if not self._failed:
+                print(f"metrics: can't write {self.path}: {e}", file=sys.stderr)
+            self._failed = True
+
+    def tick(self):
+        """Write a periodic snapshot if one is due; call it once per loop iteration."""
+        if self.path and not self._failed and time.monotonic() - self._written >= self.every:
+            self._save()
+
+    def close(self):
+        if self.path:
+            self._save()
+
+class DisabledMetrics:
+    """Stands in for Metrics when instrumentation is off: every call does nothing."""
+
+    enabled = False
+    path = None
+
+    def stage(self, name):
+        return _NO_TIMER
+
+    def observe(self, name, seconds):
+        pass
+
+    def count(self, name, amount=1, **labels):
+        pass
+
+    def error(self, exc):
+        pass
+
+    def snapshot(self):
+        return {}
+
+    def prometheus(self):
+        return ''
+
+    def write(self, path=None):
+        pass
+
+    def tick(self):
+        pass
+
+    def close(self):
+        pass
+
+DISABLED = DisabledMetrics()
+
+def metrics_for(path, namespace, every=10.0):
+    """Metrics writing to path, or DISABLED when path is empty."""
+    return Metrics(namespace, path, every) if path else DISABLED
@@ -0,0 +1,164 @@
+import sys
+import unicodedata
+from functools import lru_cache
+
+# string.punctuation, spelled out: importing string would pull in re at startup
+ASCII_PUNCTUATION = r"""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~"""
+
+# Named character classes accepted by Normalizer's punctuation/whitespace options
+PUNCTUATION_SETS = {
+    'ascii': ASCII_PUNCTUATION,   # what clean_text has always removed
+    'unicode': None,              # every Unicode punctuation (P*) and symbol (S*) character
+    'none': '',
+}
+WHITESPACE_SETS = {
+    'space': ' ',   # only the plain space, like clean_text
+    'unicode': None,  # every character for which str.isspace() is true
+    'none': '',
+}
+
+# Why a text can't be checked; every checker raises or prints these
+EMPTY_TEXT = "Cannot check empty text"
+DIGITS_ONLY = "Numbers are not allowed. Please enter text with letters."
+NOTHING_LEFT = "No valid characters to check after cleaning"
+NO_LETTERS = "Input must contain at least one letter"
+
+# Largest slice cleaned at once by the chunked scans
+_MAX_CHUNK = 1 << 16
+
+@lru_cache(maxsize=None)
+def _unicode_chars(categories):
+    """Return every code point whose general category starts with one of `categories`."""
+    return ''.join(chr(cp) for cp in range(sys.maxunicode + 1)
+                   if unicodedata.category(chr(cp))[0] in categories)
+
+@lru_cache(maxsize=None)
+def _unicode_whitespace():
+    return ''.join(chr(cp) for cp in range(sys.maxunicode + 1) if chr(cp).isspace())
+
+@lru_cache(maxsize=None)
+def _combining_marks():
+    return ''.join(chr(cp) for cp in range(sys.maxunicode + 1) if unicodedata.combining(chr(cp)))
+
+def _resolve(value, named, unicode_builder):
+    """Turn a named character class (or a literal string of characters) into a string."""
+    if value in named:
+        chars = named[value]
+        return unicode_builder() if chars is None else chars
+    if isinstance(value, str):
+        return value
+    raise ValueError(f"Unknown character class: {value!r}")
+
+class Normalizer:
+    """A clean_text pipeline compiled into str.translate tables.
+
+    The default configuration reproduces clean_text exactly: drop ASCII
+    punctuation and plain spaces, then lowercase.
+    """
+
+    def __init__(self, punctuation='ascii', whitespace='space', casefold=False,
+                 nfkd=False, strip_diacritics=False):
+        self.punctuation = punctuation
+        self.whitespace = whitespace
+        self.casefold = casefold
+        # Diacritics only become separate characters after decomposition
+        self.nfkd = nfkd or strip_diacritics
+        self.strip_diacritics = strip_diacritics
+
+        dropped = _resolve(punctuation, PUNCTUATION_SETS, lambda: _unicode_chars('PS'))
+        dropped += _resolve(whitespace, WHITESPACE_SETS, _unicode_whitespace)
+        if strip_diacritics:
+            dropped += _combining_marks()
+        self.dropped = frozenset(dropped)
+        self.table = dict.fromkeys(map(ord, self.dropped))
+        if not casefold and 'Σ' not in self.dropped:
+            # str.lower() turns a word-final sigma into 'ς', but clean_text lowers
+            # one character at a time and always gets 'σ'. Map it up front.
+            self.table[ord('Σ')] = 'σ'
+        # str.translate is only fast on ASCII strings; for other text a short
+        # list of str.replace calls beats a per-character dict lookup.
+        self._small_set = ''.join(sorted(self.dropped)) if len(self.dropped) <= 64 else None
+        self._fold_cache = {}
+
+    def clean(self, text):
+        """Return the normalized form of text."""
+        if self.nfkd:
+            text = unicodedata.normalize('NFKD', text)
+        if text.isascii() or self._small_set is None:
+            text = text.translate(self.table)
+        else:
+            for char in self._small_set:
+                if char in text:
+                    text = text.replace(char, '')
+            if not self.casefold and 'Σ' in text:
+                text = text.replace('Σ', 'σ')
+        return text.casefold() if self.casefold else text.lower()
+
+    def letter_state(self, text):
+        """Return None if nothing survives cleaning, else whether a letter does.
+
+        Cleans growing chunks from the front and stops at the first letter,
+        so ordinary text is answered after a few characters.
+        """
+        kept = False
+        start, size = 0, 16
+        while start < len(text):
+            chunk = self.clean(text[start:start + size])
+            if chunk:
+                kept = True
+                if any(c.isalpha() for c in chunk):
+                    return True
+            start += size
+            size = min(size * 2, _MAX_CHUNK)
+        return False if kept else None
+
+    def is_mirrored(self, text):
+        """Return True if the cleaned form of text reads the same backwards.
+
+        Cleans chunks from both ends and compares them inward, stopping at the
+        first mismatch. Chunks start small and double, so an early mismatch
+        costs a few characters while a full match runs at translate speed.
+        """
+        if self.nfkd:
+            # Decomposition can reorder marks across chunk edges; compare whole
+            cleaned = self.clean(text)
+            return cleaned == cleaned[::-1]
+        i, j = 0, len(text)  # text[i:j] has not been cleaned yet
+        front = back = ''    # cleaned but not yet compared; back is in reading order
+        size = 16
+        while True:
+            if not front and i < j:
+                front = self.clean(text[i:min(i + size, j)])
+                i = min(i + size, j)
+            if not back and i < j:
+                back = self.clean(text[max(j - size, i):j])
+                j = max(j - size, i)
+            if i >= j:
+                break
+            size = min(size * 2, _MAX_CHUNK)
+            if front and back:
+                n = min(len(front), len(back))
+                if front[:n] != back[:-n - 1:-1]:
+                    return False
+                front, back = front[n:], back[:-n]
+        middle = front + back
+        return middle == middle[::-1]
+
+    def fold_char(self, char):
+        """Return what a single character becomes after cleaning ('' if it's dropped)."""
+        folded = self._fold_cache.get(char)
+        if folded is None:
+            folded = self.clean(char)
+            if len(self._fold_cache) < 65536:
+                self._fold_cache[char] = folded
+        return folded
+
+    def __repr__(self):
+        return (f"Normalizer(punctuation={self.punctuation!r}, whitespace={self.whitespace!r}, "
+                f"casefold={self.casefold}, nfkd={self.nfkd}, strip_diacritics={self.strip_diacritics})")
+
+@lru_cache(maxsize=32)
+def get_normalizer(punctuation='ascii', whitespace='space', casefold=False,
+                   nfkd=False, strip_diacritics=False):
+    """Return the shared Normalizer for a configuration, building it on first use."""
+    return Normalizer(punctuation, whitespace, casefold, nfkd, strip_diacritics)
@@ -0,0 +1,110 @@
+from normalizer import get_normalizer
+
+def manacher(s):
+    """Return Manacher's radius arrays (odd, even) for s.
+
+    odd[i] is the number of odd-length palindromes centred on s[i];
+    even[i] is the number of even-length palindromes centred between
+    s[i - 1] and s[i]. Runs in O(len(s)).
+    """
+    n = len(s)
+    odd = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+
+    even = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+    return odd, even
+
+def longest_palindrome(s, radii=None):
+    """Return (start, end) of the longest palindromic substring of s.
+
+    The leftmost one wins ties; an empty string gives (0, 0). radii may
+    be manacher(s), already computed.
+    """
+    if not s:
+        return 0, 0
+    odd, even = radii or manacher(s)
+    best_start, best_len = 0, 1
+    for i in range(len(s)):
+        length = 2 * odd[i] - 1
+        if length > best_len or (length == best_len and i - odd[i] + 1 < best_start):
+            best_start, best_len = i - odd[i] + 1, length
+        length = 2 * even[i]
+        if length > best_len or (length == best_len and i - even[i] < best_start):
+            best_start, best_len = i - even[i], length
+    return best_start, best_start + best_len
+
+def count_palindromes(s, radii=None):
+    """Return how many substrings of s (counted by position) are palindromes.
+
+    radii may be manacher(s), already computed.
+    """
+    odd, even = radii or manacher(s)
+    return sum(odd) + sum(even)
+
+def prefix_function(s):
+    """Return the KMP prefix function of s."""
+    pi = [0] * len(s)
+    for i in range(1, len(s)):
+        k = pi[i - 1]
+        while k and s[i] != s[k]:
+            k = pi[k - 1]
+        if s[i] == s[k]:
+            k += 1
+        pi[i] = k
+    return pi
+
+def shortest_completion(s):
+    """Return the fewest characters to append to s to make it a palindrome.
+
+    Matches the reversed string against s with the KMP automaton; what's
+    matched at the end is the longest palindromic suffix, and everything
+    before it has to be mirrored.
+    """
+    if not s:
+        return ''
+    pattern = s[::-1]
+    pi = prefix_function(pattern)
+    k = 0
+    for char in s:
+        while k and (k == len(pattern) or char != pattern[k]):
+            k = pi[k - 1]
+        if char == pattern[k]:
+            k += 1
+    return s[:len(s) - k][::-1]
+
+def cleaned_offsets(text, normalizer=None):
+    """Return, for every character of the cleaned text, its index in text.
+
+    Only valid for normalizers without NFKD, which clean one character at
+    a time.
+    """
+    normalizer = normalizer or get_normalizer()
+    if normalizer.nfkd:
+        raise ValueError("Offsets can't be mapped through NFKD normalization")
+    offsets = []
+    fold = normalizer.fold_char
+    for index, char in enumerate(text):
+        offsets.extend([index] * len(fold(char)))
+    return offsets
+
+def to_original_span(text, start, end, normalizer=None, offsets=None):
+    """Map a [start, end) span of the cleaned text back to a span of text."""
+    if start >= end:
+        return start, start
+    offsets = offsets or cleaned_offsets(text, normalizer)
+    return offsets[start], offsets[end - 1] + 1
@@ -0,0 +1,154 @@
+"""How far is a cleaned text from being a palindrome?
+
+Two measures, both bounded by a caller-supplied k and giving up (None)
+as soon as the answer is known to exceed it:
+
+- mismatches: the character substitutions needed, i.e. mirrored pairs
+  that differ. Equal stretches are skipped with slice comparisons, so
+  cost is O(n / 64 + k) Python steps.
+- palindrome_edits: the minimum number of substitutions and deletions
+  (a deletion is as good as inserting the mirrored character). This is
+  the interval DP f(i, j) restricted to the band where the left and
+  right pointers differ by at most k, run in Landau-Vishkin order: for
+  each cost e and each diagonal only the furthest-reaching state is
+  kept, and runs of matching characters are skipped at slice speed.
+  That visits O(k^2) states where a banded table has O(n * k) cells and
+  the unbounded DP O(n^2).
+
+Edits are tuples (op, position, old, new) with op 'replace' or 'delete'
+and positions in the cleaned text; apply_edits() turns them into the
+palindrome they lead to.
+"""
+
+# Characters compared per slice when scanning for mismatched pairs
+_BLOCK = 64
+
+# Moves of the edit search, and the diagonal offset of the state each comes from
+REPLACE, DELETE_LEFT, DELETE_RIGHT = 0, 1, 2
+_SOURCE = {REPLACE: 0, DELETE_LEFT: 1, DELETE_RIGHT: -1}
+
+def mismatches(cleaned, k=None):
+    """Return the (i, j) pairs with cleaned[i] != cleaned[j], j mirroring i.
+
+    None once more than k pairs differ.
+    """
+    n = len(cleaned)
+    half = n // 2
+    rev = cleaned[::-1]
+    pairs = []
+    for start in range(0, half, _BLOCK):
+        stop = min(start + _BLOCK, half)
+        if cleaned[start:stop] == rev[start:stop]:
+            continue
+        for i in range(start, stop):
+            if cleaned[i] != rev[i]:
+                pairs.append((i, n - 1 - i))
+                if k is not None and len(pairs) > k:
+                    return None
+    return pairs
+
+def substitution_edits(cleaned, k=None):
+    """The fewest replacements that make cleaned a palindrome, or None past k."""
+    pairs = mismatches(cleaned, k)
+    if pairs is None:
+        return None
+    return [('replace', j, cleaned[j], cleaned[i]) for i, j in pairs]
+
+def fewest_substitutions(cleaned, edits, k=None):
+    """substitution_edits, given the palindrome_edits result for cleaned.
+
+    When those edits are all replacements they are already a fewest set
+    (no replacement-only answer can beat the overall minimum), so the
+    text isn't scanned again.
+    """
+    if all(edit[0] == 'replace' for edit in edits):
+        return edits
+    return substitution_edits(cleaned, k)
+
+def _common(s, rev, i, r, limit):
+    """Length of the longest common prefix of s[i:] and rev[r:], at most limit."""
+    matched, step = 0, 16
+    while matched < limit:
+        step = min(step, limit - matched)
+        if s[i + matched:i + matched + step] == rev[r + matched:r + matched + step]:
+            matched += step
+            step *= 2
+        elif step == 1:
+            break
+        else:
+            step //= 2
+    return matched
+
+def palindrome_edits(cleaned, k):
+    """The fewest replacements and deletions that make cleaned a palindrome.
+
+    Returns the list of edits, or None if more than k are needed.
+    """
+    s, n = cleaned, len(cleaned)
+    rev = s[::-1]
+    # A state is (i, r): i characters consumed from the left and r from the
+    # right, so s[i:n - r] is still open. Its diagonal is d = r - i, stored
+    # at index d + k + 1 so that d - 1 and d + 1 always exist.
+    unreached = -n - 2
+    furthest = [unreached] * (2 * k + 3)  # furthest i on each diagonal at the previous cost
+    steps = []                            # per cost: the furthest i and the move into it, by diagonal
+    for cost in range(k + 1):
+        reached = [unreached] * (2 * k + 3)
+        moves = [None] * (2 * k + 3)
+        for d in range(-cost, cost + 1):
+            at = d + k + 1
+            if cost == 0:
+                i = 0
+            else:
+                # replace stays on d; deleting on the left comes from d + 1 and
+                # consumes a left character; deleting on the right comes from d - 1
+                i, move = furthest[at] + 1, REPLACE
+                if furthest[at + 1] + 1 > i:
+                    i, move = furthest[at + 1] + 1, DELETE_LEFT
+                if furthest[at - 1] > i:
+                    i, move = furthest[at - 1], DELETE_RIGHT
+                if i < 0:
+                    continue
+                moves[at] = move
+            r = i + d
+            limit = (n - i - r) // 2
+            if limit and s[i] == rev[r]:
+                i += _common(s, rev, i, r, limit)
+            reached[at] = i
+            if n - 2 * i - d <= 1:  # at most one character left open
+                steps.append((reached, moves))
+                return _trace(s, steps, d, k)
+        steps.append((reached, moves))
+        furthest = reached
+    return None
+
+def _trace(s, steps, d, k):
+    """Walk the moves back from the final diagonal and list the edits."""
+    n = len(s)
+    edits = []
+    for cost in range(len(steps) - 1, 0, -1):
+        move = steps[cost][1][d + k + 1]
+        d += _SOURCE[move]
+        i = steps[cost - 1][0][d + k + 1]
+        right = n - 1 - (i + d)
+        if move == REPLACE:
+            edits.append(('replace', right, s[right], s[i]))
+        elif move == DELETE_LEFT:
+            edits.append(('delete', i, s[i], ''))
+        else:
+            edits.append(('delete', right, s[right], ''))
+    edits.sort(key=lambda edit: edit[1])
+    return edits
+
+def apply_edits(cleaned, edits):
+    """Return cleaned with the edits made."""
+    chars = list(cleaned)
+    for op, position, old, new in edits:
+        chars[position] = new
+    return ''.join(chars)
+
+def describe_edits(edits):
+    """One short line listing the edits, e.g. "replace 'x' at 4 with 'y'; delete 'z' at 9"."""
+    return '; '.join(f"replace {old!r} at {position} with {new!r}" if op == 'replace'
+                     else f"delete {old!r} at {position}"
+                     for op, position, old, new in edits)
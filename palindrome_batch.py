@@ -0,0 +1,177 @@
+import argparse
+import csv
+import json
+import sys
+import time
+from itertools import islice
+
+from exe_mine import check_text, classify_text
+from palindrome_approx import describe_edits, fewest_substitutions, palindrome_edits
+from result_cache import ResultCache
+
+CSV_FIELDS = ['line', 'input', 'cleaned', 'result', 'error']
+APPROX_FIELDS = ['substitutions', 'edit_distance', 'edits']
+
+def read_lines(stream):
+    """Yield (line_number, text) for every non-blank line of a stream."""
+    for number, line in enumerate(stream, 1):
+        text = line.rstrip('\r\n')
+        # Same rule as the interactive loop: blank input is skipped, not checked
+        if text.strip():
+            yield number, text
+
+def _check_only(text):
+    return '', check_text(text)
+
+def check_lines(lines, with_cleaned=True, cache=None):
+    """Turn (line_number, text) pairs into result records, one per line.
+
+    With with_cleaned=False the early-exit check is used and the cleaned
+    column is left empty. A ResultCache, if given, answers repeated lines.
+    """
+    compute = classify_text if with_cleaned else _check_only
+    for number, text in lines:
+        try:
+            if cache is not None:
+                cleaned, is_palin = cache.classify(text, compute)
+            else:
+                cleaned, is_palin = compute(text)
+        except ValueError as e:
+            yield {'line': number, 'input': text, 'cleaned': '', 'result': 'Error', 'error': str(e)}
+            continue
+        except Exception as e:
+            yield {'line': number, 'input': text, 'cleaned': '', 'result': 'Error', 'error': f"Unexpected error: {e}"}
+            continue
+        yield {'line': number, 'input': text, 'cleaned': cleaned,
+               'result': 'Palindrome' if is_palin else 'Not palindrome', 'error': ''}
+
+def check_lines_bulk(lines, with_cleaned=True, chunk_size=2000):
+    """check_lines for corpora of short lines: each chunk of chunk_size lines
+    is classified at once by palindrome_bulk.classify_many."""
+    from palindrome_bulk import classify_many
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        for (number, text), result in zip(chunk, classify_many([text for _, text in chunk])):
+            if isinstance(result, ValueError):
+                yield {'line': number, 'input': text, 'cleaned': '', 'result': 'Error', 'error': str(result)}
+            else:
+                yield {'line': number, 'input': text, 'cleaned': result[0] if with_cleaned else '',
+                       'result': 'Palindrome' if result[1] else 'Not palindrome', 'error': ''}
+
+def add_approx(records, k):
+    """Add how near each line is to a palindrome: the fewest replacements,
+    the fewest edits and the edits themselves; None past k or on errors."""
+    for record in records:
+        substitutions = edits = None
+        if record['result'] == 'Palindrome':
+            substitutions = edits = []
+        elif record['result'] == 'Not palindrome':
+            edits = palindrome_edits(record['cleaned'], k)
+            # Replacements are edits too, so there can't be fewer of them
+            if edits is not None:
+                substitutions = fewest_substitutions(record['cleaned'], edits, k)
+        record['substitutions'] = None if substitutions is None else len(substitutions)
+        record['edit_distance'] = None if edits is None else len(edits)
+        record['edits'] = None if edits is None else describe_edits(edits)
+        yield record
+
+def write_jsonl(records, out):
+    """Write records as JSON lines and return how many were written."""
+    count = 0
+    dumps = json.dumps
+    write = out.write
+    for record in records:
+        write(dumps(record, ensure_ascii=False))
+        write('\n')
+        count += 1
+    return count
+
+def write_csv(records, out):
+    """Write records as CSV with a header row and return how many were written."""
+    records = iter(records)
+    first = next(records, None)
+    # The columns are those of the first record, so added ones (--approx) come along
+    writer = csv.DictWriter(out, fieldnames=list(first) if first else CSV_FIELDS)
+    writer.writeheader()
+    count = 0
+    if first is not None:
+        writer.writerow(first)
+        count += 1
+    for record in records:
+        writer.writerow(record)
+        count += 1
+    return count
+
+WRITERS = {'jsonl': write_jsonl, 'csv': write_csv}
+
+def run_batch(source, out, fmt='jsonl', with_cleaned=True, workers=1, chunk_size=2000,
+              cache_size=0, cache_normalized=False, bulk=False, approx=None):
+    """Run the read -> clean -> check -> emit pipeline and return (count, seconds).
+
+    With workers != 1 the check step runs in a process pool (None means one
+    worker per CPU); output order is unchanged. cache_size > 0 gives each
+    process an LRU cache of that many results. bulk=True classifies chunks
+    of chunk_size lines with NumPy in this process, without a cache.
+    approx=K adds the APPROX_FIELDS columns, searched up to K edits.
+    """
+    start = time.perf_counter()
+    cache_options = {'max_entries': cache_size, 'normalized': cache_normalized} if cache_size > 0 else None
+    if bulk:
+        records = check_lines_bulk(read_lines(source), with_cleaned, chunk_size)
+    elif workers == 1:
+        cache = ResultCache(**cache_options) if cache_options else None
+        records = check_lines(read_lines(source), with_cleaned, cache)
+    else:
+        from palindrome_parallel import check_lines_parallel
+        records = check_lines_parallel(read_lines(source), workers, chunk_size, with_cleaned, cache_options)
+    if approx is not None:
+        records = add_approx(records, approx)
+    count = WRITERS[fmt](records, out)
+    return count, time.perf_counter() - start
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Check every line of a file for palindromes, without the interactive UI.")
+    parser.add_argument('input', nargs='?', default='-', help="input file, one phrase per line ('-' for stdin)")
+    parser.add_argument('-o', '--output', default='-', help="output file ('-' for stdout)")
+    parser.add_argument('-f', '--format', choices=sorted(WRITERS), default='jsonl', help="output format")
+    parser.add_argument('-j', '--workers', type=int, default=1, help="worker processes (0 = one per CPU)")
+    parser.add_argument('--chunk-size', type=int, default=2000, help="lines sent to a worker at a time")
+    parser.add_argument('--cache-size', type=int, default=0, help="cache this many results for repeated lines")
+    parser.add_argument('--cache-normalized', action='store_true', help="share cache entries between lines that clean the same")
+    parser.add_argument('--no-cleaned', action='store_true', help="skip the cleaned column and use the early-exit check")
+    parser.add_argument('--bulk', action='store_true',
+                        help="classify --chunk-size lines at a time with NumPy; fastest for many short lines")
+    parser.add_argument('--approx', type=int, metavar='K',
+                        help="also report the fewest replacements and edits (up to K) that make each line a palindrome")
+    args = parser.parse_args(argv)
+    if args.approx is not None and (args.approx < 0 or args.no_cleaned):
+        parser.error("--approx needs a K of 0 or more and the cleaned column")
+    if args.bulk and (args.workers != 1 or args.cache_size):
+        parser.error("--bulk runs in one process without a cache; drop --workers and --cache-size")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    # Large buffers so results are written in bulk rather than line by line
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8', buffering=1 << 20)
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='', buffering=1 << 20)
+    try:
+        count, elapsed = run_batch(source, out, args.format, not args.no_cleaned,
+                                   args.workers or None, args.chunk_size, args.cache_size, args.cache_normalized,
+                                   args.bulk, args.approx)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+        else:
+            out.flush()
+    rate = count / elapsed if elapsed > 0 else float('inf')
+    print(f"Checked {count} lines in {elapsed:.2f}s ({rate:,.0f} lines/sec)", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""Classify many short phrases at once.
+
+The whole batch is cleaned with one Normalizer.clean call on the joined
+text, packed into a padded uint32 code point matrix, and every row is
+compared with its own reverse in a handful of NumPy operations. For
+millions of short lines this replaces millions of Python-level calls.
+
+Without NumPy the same functions work one string at a time.
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from normalizer import DIGITS_ONLY, EMPTY_TEXT, NO_LETTERS, NOTHING_LEFT, get_normalizer
+
+# Joins the batch for cleaning; no normalizer drops or changes it, and a
+# batch containing it is cleaned string by string instead
+SEPARATOR = '\x00'
+# Rows longer than this are compared on their own rather than widening the matrix
+MAX_WIDTH = 256
+# Rows packed into one matrix at a time, bounding memory at BATCH * MAX_WIDTH * 4 bytes
+BATCH = 1 << 16
+
+def clean_many(texts, normalizer=None):
+    """Return the cleaned form of every text, as normalizer.clean would."""
+    normalizer = normalizer or get_normalizer()
+    if not texts:
+        return []
+    joined = SEPARATOR.join(texts)
+    if SEPARATOR in normalizer.dropped or joined.count(SEPARATOR) != len(texts) - 1:
+        return [normalizer.clean(text) for text in texts]
+    return normalizer.clean(joined).split(SEPARATOR)
+
+def _codepoints(cleaned):
+    """Code points of all strings end to end and each string's length,
+    or None if a string contains SEPARATOR and can't be split apart."""
+    flat = np.frombuffer(SEPARATOR.join(cleaned).encode('utf-32-le'), dtype=np.uint32)
+    ends = np.flatnonzero(flat == ord(SEPARATOR))
+    if ends.size != len(cleaned) - 1:
+        return None
+    lengths = np.diff(np.concatenate(([-1], ends, [flat.size]))) - 1
+    return flat[flat != ord(SEPARATOR)], lengths
+
+def _mirrored_rows(chars, lengths):
+    """Compare each row of a packed batch with its reverse; lengths must be <= MAX_WIDTH."""
+    width = int(lengths.max()) if lengths.size else 0
+    if width == 0:
+        return np.ones(lengths.size, dtype=bool)
+    columns = np.arange(width)
+    filled = columns < lengths[:, None]
+    matrix = np.zeros((lengths.size, width), dtype=np.uint32)
+    matrix[filled] = chars  # row-major fill: each row gets its own characters
+    # Column c mirrors column length - 1 - c, so the first half of the columns
+    # decides; padding maps onto column 0 and is masked out
+    half = (width + 1) // 2
+    mirror = np.take_along_axis(matrix, np.maximum(lengths[:, None] - 1 - columns[:half], 0), axis=1)
+    return ((matrix[:, :half] == mirror) | ~filled[:, :half]).all(axis=1)
+
+def _mirrored(cleaned, chars, lengths):
+    """are_palindromes for one packed batch."""
+    long_rows = lengths > MAX_WIDTH
+    if not long_rows.any():
+        return _mirrored_rows(chars, lengths)
+    short = ~long_rows
+    result = np.empty(len(cleaned), dtype=bool)
+    result[short] = _mirrored_rows(chars[np.repeat(short, lengths)], lengths[short])
+    for i in np.flatnonzero(long_rows).tolist():
+        result[i] = cleaned[i] == cleaned[i][::-1]
+    return result
+
+def _letters(chars, lengths):
+    """Whether each row of a packed batch contains at least one letter."""
+    # Only the code points present in the batch need the Unicode lookup
+    present = np.zeros(int(chars.max()) + 1 if chars.size else 1, dtype=bool)
+    present[chars] = True
+    codes = np.flatnonzero(present)
+    letters = np.zeros(present.size, dtype=bool)
+    letters[codes] = [chr(code).isalpha() for code in codes.tolist()]
+    running = np.concatenate(([0], np.cumsum(letters[chars])))
+    ends = np.cumsum(lengths)
+    return running[ends] > running[ends - lengths]
+
+def _batches(cleaned):
+    """Yield (part, packed) for BATCH-sized slices; packed is None when NumPy can't be used."""
+    for start in range(0, len(cleaned), BATCH):
+        part = cleaned[start:start + BATCH]
+        yield part, _codepoints(part) if np is not None else None
+
+def are_palindromes(cleaned):
+    """Return whether each already-cleaned string reads the same backwards.
+
+    A NumPy bool array when NumPy is available, otherwise a list. Strings
+    longer than MAX_WIDTH are compared one by one so that a single long
+    outlier doesn't inflate the matrix for the whole batch.
+    """
+    result = []
+    for part, packed in _batches(cleaned):
+        if packed is None:
+            result.append([text == text[::-1] for text in part])
+        else:
+            result.append(_mirrored(part, *packed))
+    if np is None:
+        return [flag for flags in result for flag in flags]
+    return np.concatenate(result) if result else np.zeros(0, dtype=bool)
+
+def _reject(text, cleaned):
+    """The ValueError classify_text raises for a text without letters."""
+    if not text:
+        return ValueError(EMPTY_TEXT)
+    if text.strip().isdigit():
+        return ValueError(DIGITS_ONLY)
+    if not cleaned:
+        return ValueError(NOTHING_LEFT)
+    return ValueError(NO_LETTERS)
+
+def classify_many(texts, normalizer=None):
+    """Classify a list of texts with the rules of exe_mine.classify_text.
+
+    Returns one entry per text: (cleaned, is_palindrome) or the ValueError
+    classify_text would have raised. A text whose cleaned form has a letter
+    can't fail any of the checks, so only the rest are looked at one by one.
+    """
+    texts = list(texts)
+    cleaned = clean_many(texts, normalizer)
+    palindromes, letters = [], []
+    for part, packed in _batches(cleaned):
+        if packed is None:
+            palindromes += [text == text[::-1] for text in part]
+            letters += [any(c.isalpha() for c in text) for text in part]
+        else:
+            palindromes += _mirrored(part, *packed).tolist()
+            letters += _letters(*packed).tolist()
+    return [(text_cleaned, is_palin) if has_letter else _reject(text, text_cleaned)
+            for text, text_cleaned, is_palin, has_letter in zip(texts, cleaned, palindromes, letters)]
@@ -0,0 +1,222 @@
+"""Answer "is cleaned[i:j] a palindrome?" in O(1) after one O(n) pass.
+
+The index keeps, for two prime moduli, polynomial prefix hashes of the
+cleaned text and of its reverse, plus the powers of the base. A span is
+a palindrome when its forward and reversed hashes agree under both
+moduli; with random bases a false match needs a collision in both, so
+its chance is around n / 2**61 per query.
+
+Hashes are stored unnormalized, H[k] = sum(c[t] * B**t for t < k) mod M,
+so building is a cumulative sum (vectorized when NumPy is available) and
+a query compares the two span hashes after shifting both to the same
+power of B.
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from normalizer import get_normalizer
+
+MAGIC = b'PIDX'
+VERSION = 1
+# Both below 2**31, so every stored value fits in 32 bits and a product of two in 62
+MODULI = (2147483647, 1000000007)
+# magic, version, text length, base for each modulus, UTF-8 byte count of the text;
+# the text follows, then the tables as little-endian uint32, starting 8-byte aligned
+_HEADER = struct.Struct('<4sHQIIQ')
+
+def _tables_offset(size):
+    end = _HEADER.size + size
+    return end + -end % 8
+
+def _build_numpy(np, codes, base, mod):
+    """(forward, reverse, powers) for the uint64 code points of the text."""
+    n = codes.size
+    mod = np.uint64(mod)
+    # Every step writes into preallocated buffers: fresh temporaries of this
+    # size cost more in page faults than the arithmetic itself
+    powers = np.empty(n + 1, dtype=np.uint64)
+    powers[0] = 1
+    filled, step = 1, base
+    while filled <= n:  # double the filled prefix: powers[f:2f] = powers[:f] * B**f
+        take = min(filled, n + 1 - filled)
+        part = powers[filled:filled + take]
+        np.multiply(powers[:take], np.uint64(step), out=part)
+        np.remainder(part, mod, out=part)
+        filled += take
+        step = step * step % int(mod)
+    tables = []
+    for values in (codes, codes[::-1]):
+        sums = np.zeros(n + 1, dtype=np.uint64)
+        np.multiply(values, powers[:n], out=sums[1:])
+        np.remainder(sums, mod, out=sums)
+        # Terms are below 2**31, so the running sums can't overflow for n < 2**33
+        np.cumsum(sums, out=sums)
+        np.remainder(sums, mod, out=sums)
+        tables.append(sums)
+    tables.append(powers)
+    result = []
+    for values in tables:
+        packed = array('I', bytes(4 * (n + 1)))
+        np.copyto(np.frombuffer(packed, dtype=np.uint32), values, casting='unsafe')
+        result.append(packed)
+    return result
+
+def _build_python(cleaned, base, mod):
+    """_build_numpy one character at a time."""
+    n = len(cleaned)
+    forward, reverse, powers = array('I', [0]) * (n + 1), array('I', [0]) * (n + 1), array('I', [1]) * (n + 1)
+    f = r = 0
+    power = 1
+    for k in range(n):
+        f = (f + ord(cleaned[k]) * power) % mod
+        r = (r + ord(cleaned[n - 1 - k]) * power) % mod
+        power = power * base % mod
+        forward[k + 1], reverse[k + 1], powers[k + 1] = f, r, power
+    return [forward, reverse, powers]
+
+class PalindromeIndex:
+    """Constant-time palindrome queries over spans of one cleaned text.
+
+        index = PalindromeIndex.from_text(corpus)
+        index.is_palindrome(10, 31)
+        index.save('corpus.pidx'); PalindromeIndex.load('corpus.pidx')
+
+    Spans are [start, end) positions in the cleaned text, like slices.
+    """
+
+    def __init__(self, cleaned, bases=None, tables=None):
+        self.text = cleaned
+        if not bases:
+            import random
+            bases = [random.randrange(1 << 20, mod - 1) for mod in MODULI]
+        self.bases = tuple(bases)
+        if tables is None:
+            try:
+                import numpy as np
+            except ImportError:
+                np = None
+            if np is None:
+                tables = [_build_python(cleaned, base, mod) for base, mod in zip(self.bases, MODULI)]
+            else:
+                codes = np.frombuffer(cleaned.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+                tables = [_build_numpy(np, codes, base, mod) for base, mod in zip(self.bases, MODULI)]
+        # (forward, reverse, powers) for each modulus
+        self.tables = tables
+
+    @classmethod
+    def from_text(cls, text, normalizer=None):
+        """Index the cleaned form of raw text."""
+        return cls((normalizer or get_normalizer()).clean(text))
+
+    def __len__(self):
+        return len(self.text)
+
+    def is_palindrome(self, start, end):
+        """Whether cleaned[start:end] reads the same backwards; O(1)."""
+        n = len(self.text)
+        if not 0 <= start <= end <= n:
+            raise IndexError(f"span [{start}, {end}) is outside the indexed text of length {n}")
+        for (forward, reverse, powers), mod in zip(self.tables, MODULI):
+            # Forward span starts at power B**start, its reverse at B**(n - end)
+            span = forward[end] - forward[start]
+            mirrored = reverse[n - start] - reverse[n - end]
+            if (span * powers[n - end] - mirrored * powers[start]) % mod:
+                return False
+        return True
+
+    def palindromes(self, spans):
+        """is_palindrome for each (start, end) pair."""
+        check = self.is_palindrome
+        return [check(start, end) for start, end in spans]
+
+    def save(self, path):
+        """Write the text and hash tables to path atomically."""
+        data = self.text.encode('utf-8')
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(self.text), *self.bases, len(data)))
+            f.write(data)
+            f.write(bytes(_tables_offset(len(data)) - _HEADER.size - len(data)))
+            for table in self.tables:
+                for values in table:
+                    if sys.byteorder == 'big':
+                        values = array('I', values)
+                        values.byteswap()
+                    f.write(values)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read an index written by save().
+
+        The file is memory-mapped and the tables are used in place, so
+        loading costs one pass over the text, not over the tables.
+        """
+        with open(path, 'rb') as f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                data = b''
+        if len(data) < _HEADER.size or data[:4] != MAGIC:
+            raise ValueError(f"{path} is not a palindrome index")
+        _, version, n, base1, base2, size = _HEADER.unpack_from(data)
+        if version != VERSION:
+            raise ValueError(f"{path}: unsupported index version {version}")
+        offset = _tables_offset(size)
+        if len(data) != offset + 4 * (n + 1) * 3 * len(MODULI):
+            raise ValueError(f"{path}: truncated or corrupt index")
+        text = data[_HEADER.size:_HEADER.size + size].decode('utf-8')
+        if len(text) != n:
+            raise ValueError(f"{path}: text length doesn't match the header")
+        view = memoryview(data)
+        tables = []
+        for _ in MODULI:
+            table = []
+            for _ in range(3):
+                values = view[offset:offset + 4 * (n + 1)].cast('I')
+                if sys.byteorder == 'big':
+                    values = array('I', values.tobytes())
+                    values.byteswap()
+                table.append(values)
+                offset += 4 * (n + 1)
+            tables.append(table)
+        return cls(text, (base1, base2), tables)
+
+def _span(value):
+    start, sep, end = value.partition(':')
+    if not sep:
+        raise ValueError(f"expected START:END, got {value!r}")
+    return int(start), int(end)
+
+def cli(argv=None):
+    """Command-line entry point, also used by first.py."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Build or query a palindrome span index over a cleaned text.")
+    parser.add_argument('spans', nargs='*', metavar='START:END', help="spans of the cleaned text to check")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--text', metavar='FILE', help="build the index from a UTF-8 text file")
+    source.add_argument('--index', metavar='PATH', help="load an index written by --save")
+    parser.add_argument('--save', metavar='PATH', help="write the built index to PATH")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    try:
+        spans = [_span(value) for value in args.spans]
+        if args.text:
+            with open(args.text, encoding='utf-8') as f:
+                index = PalindromeIndex.from_text(f.read())
+        else:
+            index = PalindromeIndex.load(args.index)
+        if args.save:
+            index.save(args.save)
+        print(f"{len(index)} cleaned characters indexed")
+        for (start, end), result in zip(spans, index.palindromes(spans)):
+            print(f"[{start}:{end}] {index.text[start:end][:60]!r}: {'palindrome' if result else 'not a palindrome'}")
+    except (OSError, ValueError, IndexError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,196 @@
+import mmap
+import sys
+import unicodedata
+
+from normalizer import DIGITS_ONLY, EMPTY_TEXT, NO_LETTERS, NOTHING_LEFT, get_normalizer
+
+# Largest number of bytes decoded at once from either end
+MAX_CHUNK = 1 << 20
+_BOM = b'\xef\xbb\xbf'
+# Pages already compared are dropped from the mapping as the scan moves on,
+# so the resident size stays at a few chunks; not every platform has madvise
+_DONTNEED = getattr(mmap, 'MADV_DONTNEED', None)
+
+def _is_continuation(byte):
+    return byte & 0xC0 == 0x80  # 0b10xxxxxx: the middle of a UTF-8 sequence
+
+def _starts_with_starter(char):
+    """True if char's decomposition begins with a combining class 0 character,
+    so NFKD never reorders anything across a cut just before it."""
+    return unicodedata.combining(unicodedata.normalize('NFKD', char)[0]) == 0
+
+class _FileText:
+    """Decodes chunks of a memory-mapped UTF-8 file, always cutting between characters.
+
+    Bytes [start, end) are the text: a leading BOM and the final line
+    terminator are left out.
+    """
+
+    def __init__(self, data, normalizer):
+        self.data = data
+        self.normalizer = normalizer
+        self.start = 3 if data[:3] == _BOM else 0
+        end = len(data)
+        if end > self.start and data[end - 1] == 0x0A:  # '\n', or the end of '\r\n'
+            end -= 1
+            if end > self.start and data[end - 1] == 0x0D:
+                end -= 1
+        self.end = end
+
+    def release(self, i, j):
+        """Drop the mapped pages wholly outside bytes [i, j) from memory."""
+        if _DONTNEED is None:
+            return
+        low = i - i % mmap.PAGESIZE
+        high = -(-j // mmap.PAGESIZE) * mmap.PAGESIZE
+        if low:
+            self.data.madvise(_DONTNEED, 0, low)
+        if high < self.end:
+            self.data.madvise(_DONTNEED, high, self.end - high)
+
+    def chunks(self, size=MAX_CHUNK):
+        """Yield the decoded text front to back, in pieces of about `size` bytes."""
+        i, end = self.start, self.end
+        while i < end:
+            stop = min(i + size, end)
+            while stop < end and _is_continuation(self.data[stop]):
+                stop += 1
+            yield self.data[i:stop].decode('utf-8')
+            i = stop
+            self.release(i, end)
+
+    def take_front(self, i, j, size):
+        """Clean the chunk starting at byte i; return (cleaned, new i)."""
+        stop = min(i + size, j)
+        while stop < j and _is_continuation(self.data[stop]):
+            stop += 1
+        text = self.data[i:stop].decode('utf-8')
+        if self.normalizer.nfkd and stop < j:
+            # Leave the trailing marks for the next chunk: cut before the last starter
+            cut = len(text) - 1
+            while cut > 0 and not _starts_with_starter(text[cut]):
+                cut -= 1
+            if cut > 0:
+                stop -= len(text[cut:].encode('utf-8'))
+                text = text[:cut]
+        return self.normalizer.clean(text), stop
+
+    def take_back(self, i, j, size):
+        """Clean the chunk ending at byte j; return (cleaned, new j)."""
+        start = max(j - size, i)
+        while start > i and _is_continuation(self.data[start]):
+            start -= 1
+        text = self.data[start:j].decode('utf-8')
+        if self.normalizer.nfkd and start > i:
+            # Start the chunk at a starter so its marks stay with their base character
+            cut = 0
+            while cut < len(text) - 1 and not _starts_with_starter(text[cut]):
+                cut += 1
+            if cut:
+                start += len(text[:cut].encode('utf-8'))
+                text = text[cut:]
+        return self.normalizer.clean(text), start
+
+    def only_digits(self):
+        """The file-sized version of text.strip().isdigit()."""
+        state = 'lead'  # then 'digits', then 'trail' once whitespace follows the digits
+        for chunk in self.chunks():
+            core = chunk.strip()
+            if not core:
+                if state == 'digits':
+                    state = 'trail'
+                continue
+            if not core.isdigit() or state == 'trail' or (state == 'digits' and chunk[0].isspace()):
+                return False
+            state = 'trail' if chunk[-1].isspace() else 'digits'
+        return state != 'lead'
+
+    def letter_state(self):
+        """None if nothing survives cleaning, else whether a letter does."""
+        kept = False
+        for chunk in self.chunks(1 << 16):
+            cleaned = self.normalizer.clean(chunk)
+            if cleaned:
+                kept = True
+                if any(c.isalpha() for c in cleaned):
+                    return True
+        return False if kept else None
+
+    def is_mirrored(self):
+        """Compare cleaned chunks from both ends inward, stopping at the first mismatch."""
+        i, j = self.start, self.end  # bytes [i, j) have not been cleaned yet
+        front = back = ''            # cleaned but not yet compared; back is in reading order
+        size = 16
+        while True:
+            if not front and i < j:
+                front, i = self.take_front(i, j, size)
+            if not back and i < j:
+                back, j = self.take_back(i, j, size)
+            if i >= j:
+                break
+            if size == MAX_CHUNK:
+                self.release(i, j)
+            size = min(size * 2, MAX_CHUNK)
+            if front and back:
+                n = min(len(front), len(back))
+                if front[:n] != back[:-n - 1:-1]:
+                    return False
+                front, back = front[n:], back[:-n]
+        middle = front + back
+        return middle == middle[::-1]
+
+def check_file(path, normalizer=None):
+    """Return whether the text of a UTF-8 file is a palindrome.
+
+    Same rules and ValueError messages as exe_mine.classify_text, but the
+    file is memory-mapped and compared from both ends a chunk at a time,
+    so memory stays at a few MB whatever the file size and a mismatch
+    near either end is found without reading the rest. Invalid UTF-8
+    raises UnicodeDecodeError (a ValueError).
+
+    The newline ending the file's last line is ignored, as input() and
+    palindrome_batch drop line terminators, so a one-line file checks the
+    same as typing that line.
+    """
+    normalizer = normalizer or get_normalizer()
+    with open(path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # an empty file can't be mapped
+            raise ValueError(EMPTY_TEXT)
+    with data:
+        text = _FileText(data, normalizer)
+        if text.start >= text.end:
+            raise ValueError(EMPTY_TEXT)
+        if text.only_digits():
+            raise ValueError(DIGITS_ONLY)
+        has_letter = text.letter_state()
+        if has_letter is None:
+            raise ValueError(NOTHING_LEFT)
+        if not has_letter:
+            raise ValueError(NO_LETTERS)
+        return text.is_mirrored()
+
+def cli(argv=None):
+    """Command-line entry point, also used by first.py."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Check whether whole files are palindromes, without loading them.")
+    parser.add_argument('files', nargs='+', metavar='FILE')
+    parser.add_argument('--punctuation', default='ascii', help="ascii (default), unicode, none or literal characters")
+    parser.add_argument('--whitespace', default='space', help="space (default), unicode, none or literal characters")
+    parser.add_argument('--casefold', action='store_true')
+    parser.add_argument('--strip-diacritics', action='store_true')
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    normalizer = get_normalizer(args.punctuation, args.whitespace, args.casefold,
+                                strip_diacritics=args.strip_diacritics)
+    status = 0
+    for path in args.files:
+        try:
+            result = "palindrome" if check_file(path, normalizer) else "not a palindrome"
+        except (OSError, ValueError) as e:
+            result, status = f"error: {e}", 1
+        print(f"{path}: {result}")
+    return status
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,48 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from palindrome_batch import check_lines
+from result_cache import ResultCache
+
+# Per-process result cache, created by the first chunk a worker handles
+_worker_cache = None
+
+def _check_chunk(chunk, with_cleaned, cache_options):
+    """Worker entry point: classify one chunk of (line_number, text) pairs."""
+    global _worker_cache
+    if cache_options and _worker_cache is None:
+        _worker_cache = ResultCache(**cache_options)
+    return list(check_lines(chunk, with_cleaned, _worker_cache))
+
+def _chunks(lines, chunk_size):
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def check_lines_parallel(lines, workers=None, chunk_size=2000, with_cleaned=True, cache_options=None):
+    """Like check_lines, but spreads chunks of input over a pool of processes.
+
+    Records come back in input order. Only a few chunks per worker are in
+    flight at once, so memory stays flat however long the input is.
+    cache_options, if given, are ResultCache arguments for a cache in each
+    worker.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        cache = ResultCache(**cache_options) if cache_options else None
+        yield from check_lines(lines, with_cleaned, cache)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunks(lines, chunk_size):
+            pending.append(pool.submit(_check_chunk, chunk, with_cleaned, cache_options))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
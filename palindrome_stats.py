@@ -0,0 +1,117 @@
+import os
+
+class StatsAccumulator:
+    """Running statistics over palindrome checks.
+
+    Every add() is O(1): counters, min/max and a histogram of input lengths
+    are updated in place, and percentiles are read off the histogram, so the
+    cost of a report doesn't depend on how many checks came before.
+    Accumulators from different workers or sessions combine with merge().
+    """
+
+    __slots__ = ('total', 'palindromes', 'min_length', 'max_length', 'length_counts',
+                 'longest', 'shortest', 'longest_inside')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.total = 0
+        self.palindromes = 0
+        self.min_length = None
+        self.max_length = None
+        self.length_counts = {}  # input length -> number of checks
+        self.longest = ''        # longest cleaned palindrome
+        self.shortest = ''       # shortest cleaned palindrome
+        self.longest_inside = ''  # longest palindrome found inside a non-palindrome
+
+    def add(self, text, cleaned, is_palin):
+        """Record one successful check."""
+        length = len(text)
+        self.total += 1
+        self.length_counts[length] = self.length_counts.get(length, 0) + 1
+        if self.min_length is None or length < self.min_length:
+            self.min_length = length
+        if self.max_length is None or length > self.max_length:
+            self.max_length = length
+        if is_palin:
+            self.palindromes += 1
+            if len(cleaned) > len(self.longest):
+                self.longest = cleaned
+            if not self.shortest or len(cleaned) < len(self.shortest):
+                self.shortest = cleaned
+
+    def add_inside(self, palindrome):
+        """Record a palindrome found inside a non-palindromic input."""
+        if len(palindrome) > len(self.longest_inside):
+            self.longest_inside = palindrome
+
+    @property
+    def not_palindromes(self):
+        return self.total - self.palindromes
+
+    @property
+    def success_rate(self):
+        return self.palindromes / self.total * 100 if self.total else 0.0
+
+    def percentile(self, p):
+        """Return the p-th percentile (0-100) of input length, or None with no data."""
+        if not self.total:
+            return None
+        rank = max(1, -(-self.total * p // 100))  # nearest-rank method
+        seen = 0
+        for length in sorted(self.length_counts):
+            seen += self.length_counts[length]
+            if seen >= rank:
+                return length
+        return self.max_length
+
+    def merge(self, other):
+        """Fold another accumulator into this one and return self."""
+        self.total += other.total
+        self.palindromes += other.palindromes
+        for length, count in other.length_counts.items():
+            self.length_counts[length] = self.length_counts.get(length, 0) + count
+        if other.min_length is not None and (self.min_length is None or other.min_length < self.min_length):
+            self.min_length = other.min_length
+        if other.max_length is not None and (self.max_length is None or other.max_length > self.max_length):
+            self.max_length = other.max_length
+        if len(other.longest) > len(self.longest):
+            self.longest = other.longest
+        if other.shortest and (not self.shortest or len(other.shortest) < len(self.shortest)):
+            self.shortest = other.shortest
+        self.add_inside(other.longest_inside)
+        return self
+
+    def to_dict(self):
+        data = {name: getattr(self, name) for name in self.__slots__}
+        # JSON object keys must be strings
+        data['length_counts'] = {str(k): v for k, v in self.length_counts.items()}
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        for name in cls.__slots__:
+            if name in data:
+                setattr(stats, name, data[name])
+        stats.length_counts = {int(k): v for k, v in data.get('length_counts', {}).items()}
+        return stats
+
+    def save(self, path):
+        """Write the accumulator to path atomically."""
+        import json
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read an accumulator written by save(), or None if there isn't one."""
+        import json
+        try:
+            with open(path, encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError):
+            return None
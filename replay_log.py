@@ -0,0 +1,282 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+from Battleship import ProfessionalBattleship
+from ttt_ai import DIFFICULTY, PerfectPlayer, load_table
+from ttt_engine import Board, check_winner
+
+MAGIC = b'GLOG'
+VERSION = 1
+
+BATTLESHIP, TICTACTOE = 1, 2
+KINDS = {BATTLESHIP: 'battleship', TICTACTOE: 'tictactoe'}
+# Outcomes as stored in the log: '' is an unfinished game
+RESULTS = ('', 'X', 'O', 'Tie', 'won', 'lost')
+LEVELS = list(DIFFICULTY)
+
+class ReplayError(ValueError):
+    """A log that can't be read, or a game that doesn't replay the way it was recorded."""
+
+class GameRecord:
+    """One recorded game.
+
+    Battleship moves are target * 2, plus 1 for a radar scan. Tic-Tac-Toe
+    moves are the squares of both sides in order, X first; options holds
+    the human's mark (bit 0, set for O) and the difficulty (index in
+    LEVELS, shifted left by one).
+    """
+
+    __slots__ = ('kind', 'seed', 'options', 'result', 'moves')
+
+    def __init__(self, kind, seed, options=0, result='', moves=()):
+        self.kind = kind
+        self.seed = seed
+        self.options = options
+        self.result = result
+        self.moves = list(moves)
+
+    def __repr__(self):
+        return (f"GameRecord({KINDS.get(self.kind, self.kind)}, seed={self.seed}, "
+                f"result={self.result!r}, moves={self.moves})")
+
+# -- encoding ------------------------------------------------------------
+
+def _put_varint(out, value):
+    if value < 0:
+        raise ReplayError(f"Can't store negative value {value} in a game log")
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _get_varint(data, pos):
+    byte = data[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    value, shift = byte & 0x7F, 7
+    while True:
+        pos += 1
+        byte = data[pos]
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos + 1
+        shift += 7
+
+def encode_record(record, out=None):
+    """Append one record to bytearray `out` (a new one by default) and return it."""
+    out = bytearray() if out is None else out
+    for value in (record.kind, record.seed, record.options, RESULTS.index(record.result), len(record.moves)):
+        _put_varint(out, value)
+    for move in record.moves:
+        _put_varint(out, move)
+    return out
+
+def decode_records(data):
+    """Yield the GameRecords in `data` (a whole log, header included)."""
+    if data[:len(MAGIC)] != MAGIC:
+        raise ReplayError("Not a game log")
+    if len(data) == len(MAGIC):
+        raise ReplayError("Log is truncated: the header has no version")
+    if data[len(MAGIC)] != VERSION:
+        raise ReplayError(f"Unsupported log version {data[len(MAGIC)]}")
+    pos, end = len(MAGIC) + 1, len(data)
+    try:
+        while pos < end:
+            kind, pos = _get_varint(data, pos)
+            seed, pos = _get_varint(data, pos)
+            options, pos = _get_varint(data, pos)
+            result, pos = _get_varint(data, pos)
+            count, pos = _get_varint(data, pos)
+            moves = []
+            for _ in range(count):
+                move, pos = _get_varint(data, pos)
+                moves.append(move)
+            yield GameRecord(kind, seed, options, RESULTS[result], moves)
+    except IndexError:
+        raise ReplayError(f"Log is truncated or corrupt at byte {pos}")
+
+def append_records(path, records):
+    """Append records to the log at path, writing the header if the file is new.
+
+    If a record can't be encoded nothing is added: the log is cut back to
+    its old length, and a log this call created is removed.
+    """
+    out = bytearray()
+    with open(path, 'ab') as f:
+        start = f.tell()
+        if start == 0:
+            out += MAGIC + bytes([VERSION])
+        try:
+            for record in records:
+                encode_record(record, out)
+                if len(out) >= 1 << 20:
+                    f.write(out)
+                    out.clear()
+            f.write(out)
+        except ReplayError:
+            f.truncate(start)
+            if start == 0:
+                f.close()
+                os.remove(path)
+            raise
+
+def read_records(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    return decode_records(data)
+
+# -- recording -----------------------------------------------------------
+
+def battleship_status(game):
+    if len(game.hits) >= game.ship_size:
+        return 'won'
+    if game.is_over():
+        return 'lost'
+    return ''
+
+def battleship_record(game):
+    """Build the record of a ProfessionalBattleship game from its seed and actions."""
+    moves = [target * 2 + (kind == 'radar') for kind, target in game.actions]
+    return GameRecord(BATTLESHIP, game.seed, 0, battleship_status(game), moves)
+
+def tictactoe_record(seed, user_mark, difficulty, moves, result):
+    options = (user_mark == 'O') | LEVELS.index(difficulty) << 1
+    return GameRecord(TICTACTOE, seed, options, result or '', moves)
+
+# -- replay --------------------------------------------------------------
+
+def replay_battleship(record):
+    """Re-run a Battleship record with no output or pauses; return the outcome."""
+    game = ProfessionalBattleship(fast=True, seed=record.seed)
+    for move in record.moves:
+        target = move >> 1
+        if game.is_over():
+            raise ReplayError("Move after the game ended")
+        if not 0 <= target < game.size:
+            raise ReplayError(f"Target {target} is off the board")
+        if move & 1:
+            if game.radar_uses <= 0:
+                raise ReplayError("Radar used with none left")
+            game.use_radar(target)
+        elif target in game.hits or target in game.misses:
+            raise ReplayError(f"Fired at {target} twice")
+        else:
+            game.shoot(target)
+    return battleship_status(game)
+
+def replay_tictactoe(record, players):
+    """Re-run a Tic-Tac-Toe record, checking every computer move against the
+    engine; `players` maps difficulty -> PerfectPlayer. Return the outcome."""
+    user = 'O' if record.options & 1 else 'X'
+    try:
+        player = players[LEVELS[record.options >> 1]]
+    except IndexError:
+        raise ReplayError(f"Unknown difficulty in options {record.options}")
+    player.rng = random.Random(record.seed)
+    board, turn = Board(), 'X'
+    for square in record.moves:
+        if check_winner(board):
+            raise ReplayError("Move after the game ended")
+        if not 0 <= square < 9 or board[square] != " ":
+            raise ReplayError(f"Illegal move {square}")
+        if turn != user:
+            expected = player.choose_move(board, turn)
+            if expected != square:
+                raise ReplayError(f"Computer played {square}, the engine now plays {expected}")
+        board[square] = turn
+        turn = 'O' if turn == 'X' else 'X'
+    return check_winner(board) or ''
+
+def verify(records, table=None):
+    """Replay every record; yield (number, record, message) for each that doesn't match."""
+    table = table if table is not None else load_table()
+    players = {level: PerfectPlayer(level, table) for level in LEVELS}
+    for number, record in enumerate(records):
+        try:
+            if record.kind == BATTLESHIP:
+                result = replay_battleship(record)
+            elif record.kind == TICTACTOE:
+                result = replay_tictactoe(record, players)
+            else:
+                raise ReplayError(f"Unknown game kind {record.kind}")
+        except ReplayError as e:
+            yield number, record, str(e)
+            continue
+        if result != record.result:
+            yield number, record, f"Recorded {record.result or 'unfinished'!r}, replayed {result or 'unfinished'!r}"
+
+# -- random games, for exercising the replayer ----------------------------
+
+def random_games(count, seed=None, table=None):
+    """Yield `count` recorded games with random human moves, played on the real engines."""
+    rng = random.Random(seed)
+    table = table if table is not None else load_table()
+    for _ in range(count):
+        game_seed = rng.getrandbits(32)
+        if rng.random() < 0.5:
+            game = ProfessionalBattleship(fast=True, seed=game_seed)
+            targets = list(range(game.size))
+            rng.shuffle(targets)
+            while not game.is_over():
+                if game.radar_uses and rng.random() < 0.2:
+                    game.use_radar(rng.randrange(game.size))
+                else:
+                    game.shoot(targets.pop())
+            yield battleship_record(game)
+        else:
+            user, difficulty = rng.choice('XO'), rng.choice(LEVELS)
+            player = PerfectPlayer(difficulty, table, random.Random(game_seed))
+            board, turn, moves = Board(), 'X', []
+            while not check_winner(board):
+                if turn == user:
+                    square = rng.choice(board.available_moves())
+                else:
+                    square = player.choose_move(board, turn)
+                board[square] = turn
+                moves.append(square)
+                turn = 'O' if turn == 'X' else 'X'
+            yield tictactoe_record(game_seed, user, difficulty, moves, check_winner(board))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay game logs at full speed and report any game that no longer matches.")
+    parser.add_argument('logs', nargs='+', metavar='LOG')
+    parser.add_argument('--generate', type=int, metavar='N', default=0,
+                        help="first append N random games to each log")
+    parser.add_argument('--seed', type=int, default=None, help="seed for --generate")
+    parser.add_argument('--show', type=int, default=10, help="mismatches to print (default 10)")
+    args = parser.parse_args(argv)
+
+    table = load_table()
+    failures = 0
+    for path in args.logs:
+        if args.generate:
+            append_records(path, random_games(args.generate, args.seed, table))
+        total = [0]
+
+        def counted(records):
+            for record in records:
+                total[0] += 1
+                yield record
+
+        start = time.perf_counter()
+        try:
+            for number, record, message in verify(counted(read_records(path)), table):
+                failures += 1
+                if failures <= args.show:
+                    print(f"{path}: game {number}: {message}: {record!r}")
+        except (OSError, ReplayError) as e:
+            print(f"{path}: {e}", file=sys.stderr)
+            failures += 1
+            continue
+        elapsed = time.perf_counter() - start
+        print(f"{path}: {total[0]} games replayed in {elapsed:.2f}s "
+              f"({total[0] / elapsed if elapsed else 0:,.0f} games/sec)", file=sys.stderr)
+    if failures:
+        print(f"{failures} game(s) did not replay as recorded")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
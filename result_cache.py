@@ -0,0 +1,81 @@
+from collections import OrderedDict
+
+from normalizer import get_normalizer
+
+class ResultCache:
+    """Bounded LRU cache of palindrome results keyed by input text.
+
+    Entries are evicted least-recently-used first once there are more than
+    `max_entries` of them, or once the cached text adds up to more than
+    `max_chars` characters (if set). With normalized=True the key is the
+    cleaned text, so inputs that differ only in case, spaces or punctuation
+    share one entry.
+
+    Only successful checks are cached; inputs that raise go through every
+    time, with the same error as before.
+    """
+
+    def __init__(self, max_entries=4096, max_chars=None, normalized=False, normalizer=None):
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self.normalized = normalized
+        self._normalizer = normalizer or get_normalizer()
+        self._entries = OrderedDict()
+        self._chars = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, text):
+        return self._normalizer.clean(text) if self.normalized else text
+
+    def get(self, key):
+        """Return the cached value for key (marking it recently used), or None."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._chars -= self._size(key, old)
+        self._entries[key] = value
+        self._chars += self._size(key, value)
+        while self._entries and (len(self._entries) > self.max_entries or
+                                 (self.max_chars is not None and self._chars > self.max_chars)):
+            old_key, old_value = self._entries.popitem(last=False)
+            self._chars -= self._size(old_key, old_value)
+            self.evictions += 1
+
+    @staticmethod
+    def _size(key, value):
+        return len(key) + len(value[0])
+
+    def classify(self, text, compute):
+        """Return compute(text), served from the cache when possible."""
+        key = self.key(text)
+        value = self.get(key)
+        if value is None:
+            value = compute(text)
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self._chars = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups * 100 if lookups else 0.0
+
+    def info(self):
+        return {'entries': len(self._entries), 'chars': self._chars, 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions}
@@ -0,0 +1,160 @@
+import os
+import random
+
+from ttt_engine import FULL, WINS
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ttt_solved.json')
+
+# Chance of playing the optimal move at each level; otherwise the move is random
+DIFFICULTY = {'easy': 0.2, 'medium': 0.6, 'hard': 0.9, 'perfect': 1.0}
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+def _transform(square_map):
+    """Build a 512-entry table applying a square permutation to a 9-bit mask."""
+    table = [0]
+    # Each mask is a smaller one (its top bit cleared) plus one square,
+    # so the table builds in 512 steps at import time
+    for bits in range(1, FULL + 1):
+        top = bits.bit_length() - 1
+        table.append(table[bits ^ (1 << top)] | 1 << square_map[top])
+    return table
+
+def _symmetries():
+    rotate = [6, 3, 0, 7, 4, 1, 8, 5, 2]   # square i moves to rotate[i]
+    mirror = [2, 1, 0, 5, 4, 3, 8, 7, 6]
+    maps, current = [], list(range(9))
+    for _ in range(4):
+        maps.append(current)
+        maps.append([mirror[s] for s in current])
+        current = [rotate[s] for s in current]
+    return [_transform(m) for m in maps]
+
+SYMMETRIES = _symmetries()
+
+def canonical(me, opp):
+    """Return one key shared by a position and its 7 rotations/reflections."""
+    return min((sym[me] << 9) | sym[opp] for sym in SYMMETRIES)
+
+def negamax(me, opp, alpha=-100, beta=100, table=None):
+    """Score the position for the side to move (`me`) with alpha-beta pruning.
+
+    A win scores 1 + the squares still empty, so quicker wins score higher;
+    a draw scores 0. `table` is a transposition table keyed by canonical()
+    holding (value, bound) pairs.
+    """
+    if WINS[opp]:
+        return -(1 + bin(FULL & ~(me | opp)).count('1'))
+    empty = FULL & ~(me | opp)
+    if not empty:
+        return 0
+    if table is None:
+        table = {}
+
+    key = canonical(me, opp)
+    entry = table.get(key)
+    if entry is not None:
+        value, bound = entry
+        if bound == EXACT:
+            return value
+        if bound == LOWER and value >= beta:
+            return value
+        if bound == UPPER and value <= alpha:
+            return value
+
+    original_alpha = alpha
+    best = -100
+    while empty:
+        bit = empty & -empty
+        empty ^= bit
+        score = -negamax(opp, me | bit, -beta, -alpha, table)
+        if score > best:
+            best = score
+        if best > alpha:
+            alpha = best
+        if alpha >= beta:
+            break
+
+    if best <= original_alpha:
+        table[key] = (best, UPPER)
+    elif best >= beta:
+        table[key] = (best, LOWER)
+    else:
+        table[key] = (best, EXACT)
+    return best
+
+def solve():
+    """Return {canonical key: exact score} for every reachable position."""
+    scratch, solved = {}, {}
+    stack = [(0, 0)]
+    while stack:
+        me, opp = stack.pop()
+        key = canonical(me, opp)
+        if key in solved:
+            continue
+        solved[key] = negamax(me, opp, table=scratch)
+        if WINS[opp]:
+            continue
+        empty = FULL & ~(me | opp)
+        while empty:
+            bit = empty & -empty
+            empty ^= bit
+            stack.append((opp, me | bit))
+    return solved
+
+def load_table(path=TABLE_PATH):
+    """Load the solved table from disk, solving and saving it the first time."""
+    import json
+    try:
+        with open(path, encoding='utf-8') as f:
+            return {int(k): v for k, v in json.load(f).items()}
+    except (OSError, ValueError):
+        pass
+    table = solve()
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(table, f)
+    except OSError:
+        pass  # read-only install: solving again next time is cheap enough
+    return table
+
+class PerfectPlayer:
+    """Computer player backed by the solved table.
+
+    At difficulty 'perfect' it never loses; lower levels play a random move
+    some of the time (see DIFFICULTY).
+    """
+
+    def __init__(self, difficulty='perfect', table=None, rng=None):
+        if difficulty not in DIFFICULTY:
+            raise ValueError(f"Unknown difficulty: {difficulty!r}")
+        self.skill = DIFFICULTY[difficulty]
+        self.table = table if table is not None else load_table()
+        self.rng = rng or random.Random()
+        self._best = {}  # (me, opp) -> optimal squares, filled as positions come up
+
+    def best_moves(self, me, opp):
+        """Return every optimal square for the side holding `me`."""
+        moves = self._best.get((me, opp))
+        if moves is not None:
+            return moves
+        best, moves = None, []
+        empty = FULL & ~(me | opp)
+        for square in range(9):
+            bit = 1 << square
+            if not empty & bit:
+                continue
+            score = -self.table[canonical(opp, me | bit)]
+            if best is None or score > best:
+                best, moves = score, [square]
+            elif score == best:
+                moves.append(square)
+        self._best[(me, opp)] = moves
+        return moves
+
+    def choose_move(self, board, mark):
+        """Pick a square for `mark` ("X" or "O") on a ttt_engine.Board."""
+        me, opp = (board.x, board.o) if mark == "X" else (board.o, board.x)
+        if self.rng.random() < self.skill:
+            return self.rng.choice(self.best_moves(me, opp))
+        return self.rng.choice(board.available_moves())
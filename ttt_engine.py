@@ -0,0 +1,85 @@
+# Each player's marks are a 9-bit integer (bit i = square i): a move is an OR,
+# a win test is an AND against a line mask, and a full board is one comparison.
+LINES = [(0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)]
+WIN_MASKS = tuple((1 << a) | (1 << b) | (1 << c) for a, b, c in LINES)
+FULL = 0b111111111
+
+# WINS[bits] says whether a player holding `bits` has three in a row
+WINS = tuple(any(bits & mask == mask for mask in WIN_MASKS) for bits in range(FULL + 1))
+
+class Board:
+    """A 3x3 board that behaves like the old list of " "/"X"/"O" strings."""
+
+    __slots__ = ('x', 'o')
+
+    def __init__(self, x=0, o=0):
+        self.x = x
+        self.o = o
+
+    def _bit(self, index):
+        if not -9 <= index < 9:
+            raise IndexError("board index out of range")
+        return 1 << (index % 9)
+
+    def __getitem__(self, index):
+        bit = self._bit(index)
+        if self.x & bit:
+            return "X"
+        if self.o & bit:
+            return "O"
+        return " "
+
+    def __setitem__(self, index, mark):
+        bit = self._bit(index)
+        self.x &= ~bit
+        self.o &= ~bit
+        if mark == "X":
+            self.x |= bit
+        elif mark == "O":
+            self.o |= bit
+
+    def __len__(self):
+        return 9
+
+    def __iter__(self):
+        return (self[i] for i in range(9))
+
+    def __contains__(self, mark):
+        return any(square == mark for square in self)
+
+    def __eq__(self, other):
+        return isinstance(other, Board) and self.x == other.x and self.o == other.o
+
+    def __hash__(self):
+        return hash((self.x, self.o))
+
+    def __repr__(self):
+        return f"Board({''.join(self)!r})"
+
+    def copy(self):
+        return Board(self.x, self.o)
+
+    def empty_mask(self):
+        return FULL & ~(self.x | self.o)
+
+    def available_moves(self):
+        """Return the empty squares, lowest index first."""
+        empty = self.empty_mask()
+        return [i for i in range(9) if empty >> i & 1]
+
+def check_winner(board):
+    """Return "X" or "O" for a winner, "Tie" for a full board, else None."""
+    if WINS[board.x]:
+        return "X"
+    if WINS[board.o]:
+        return "O"
+    if board.x | board.o == FULL:
+        return "Tie"
+    return None
+
+def print_board(board):
+    print(f"\n {board[0]} | {board[1]} | {board[2]} ")
+    print("-----------")
+    print(f" {board[3]} | {board[4]} | {board[5]} ")
+    print("-----------")
+    print(f" {board[6]} | {board[7]} | {board[8]} \n")
@@ -0,0 +1,219 @@
+"""Monte Carlo Tree Search for Tic-Tac-Toe on boards too big to solve.
+
+MCTSPlayer picks moves on a gomoku_engine.GomokuBoard within a per-move
+time budget: UCT selection, one random playout per iteration, results
+backed up along the path. The subtree under the position reached is kept
+between moves, so the playouts already spent on the move that was
+actually played carry over.
+
+With workers > 1 the search is root-parallel: each worker process grows
+its own tree from the same position (keeping it between moves too), and
+the visit and win counts that each task added at the root are summed
+before choosing. All tasks of a move share one wall-clock deadline, so a
+process that happens to run two of them doesn't think twice as long.
+X is assumed to move first, as in game.py.
+"""
+import math
+import random
+import time
+
+from gomoku_engine import GomokuBoard
+
+OTHER = {"X": "O", "O": "X"}
+# Time kept back from the budget (up to half of it) for sending the
+# statistics back from the worker processes
+IPC_MARGIN = 0.002
+
+class Node:
+    """A position in the search tree, reached by `mark` playing `move`.
+
+    wins counts playouts won by `mark` (a tie is half a win), so a parent
+    picks the child that is best for the side choosing it.
+    """
+
+    __slots__ = ('move', 'mark', 'parent', 'children', 'untried', 'visits', 'wins')
+
+    def __init__(self, move, mark, parent, untried):
+        self.move = move
+        self.mark = mark
+        self.parent = parent
+        self.children = {}
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+
+    def select(self, exploration):
+        """The child with the highest UCT score."""
+        scale = exploration * math.sqrt(math.log(self.visits))
+        best, best_score = None, -1.0
+        for child in self.children.values():
+            score = child.wins / child.visits + scale / math.sqrt(child.visits)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+def _untried(board, rng):
+    if board.result is not None:
+        return []
+    moves = board.empty[:]
+    rng.shuffle(moves)
+    return moves
+
+def _rollout(board, mark, rng):
+    """Play random moves, `mark` first, until the game ends; return the result."""
+    empty, draw = board.empty, rng.random
+    while True:
+        result = board.play(empty[int(draw() * len(empty))], mark)
+        if result is not None:
+            return result
+        mark = OTHER[mark]
+
+def search(root, board, deadline, rng, exploration=1.4):
+    """Grow the tree under root (board's position) until deadline; return the playout count."""
+    playouts = 0
+    clock = time.perf_counter
+    while True:
+        node, game = root, board.copy()
+        # Selection: follow UCT while every move of the node has been tried
+        while not node.untried and node.children:
+            node = node.select(exploration)
+            game.play(node.move, node.mark)
+        # Expansion: add one untried move
+        if node.untried:
+            move, mark = node.untried.pop(), OTHER[node.mark]
+            game.play(move, mark)
+            child = Node(move, mark, node, _untried(game, rng))
+            node.children[move] = child
+            node = child
+        result = game.result or _rollout(game, OTHER[node.mark], rng)
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if result == node.mark:
+                node.wins += 1.0
+            elif result == "Tie":
+                node.wins += 0.5
+            node = node.parent
+        playouts += 1
+        if clock() >= deadline:
+            return playouts
+
+class _Tree:
+    """The tree of the last search, and the moves of the position at its root."""
+
+    def __init__(self):
+        self.root = None
+        self.shape = None
+        self.moves = ()
+
+    def position(self, board, mark, rng):
+        """The root for board's position: the old subtree if the game went through it."""
+        node = self.root
+        if node is not None and self.shape == (board.size, board.k) \
+                and tuple(board.moves[:len(self.moves)]) == self.moves:
+            for move in board.moves[len(self.moves):]:
+                node = node.children.get(move)
+                if node is None:
+                    break
+        else:
+            node = None
+        if node is None or node.mark == mark:
+            node = Node(None, OTHER[mark], None, _untried(board, rng))
+        node.parent = None  # let the rest of the old tree go
+        self.root, self.shape, self.moves = node, (board.size, board.k), tuple(board.moves)
+        return node
+
+def root_stats(root):
+    """{move: (visits, wins)} for the moves searched from root."""
+    return {move: (child.visits, child.wins) for move, child in root.children.items()}
+
+# Per-process tree, kept between the tasks a worker runs
+_worker_tree = None
+
+def _search_task(size, k, moves, mark, deadline, exploration, seed):
+    """Worker entry point: search the position after `moves` until deadline,
+    a time.time() value; return the root counts this task added."""
+    global _worker_tree
+    deadline = time.perf_counter() + (deadline - time.time())
+    if _worker_tree is None:
+        _worker_tree = _Tree()
+    board = GomokuBoard(size, k)
+    for ply, move in enumerate(moves):
+        board.play(move, "X" if ply % 2 == 0 else "O")
+    rng = random.Random(seed)
+    root = _worker_tree.position(board, mark, rng)
+    before = root_stats(root)
+    playouts = search(root, board, deadline, rng, exploration)
+    added = {}
+    for move, (visits, wins) in root_stats(root).items():
+        old_visits, old_wins = before.get(move, (0, 0.0))
+        if visits > old_visits:
+            added[move] = (visits - old_visits, wins - old_wins)
+    return added, playouts
+
+def _ready():
+    """Worker no-op, run once per process to start the pool ahead of the clock."""
+    return None
+
+class MCTSPlayer:
+    """Computer player for GomokuBoard games, thinking `budget` seconds a move.
+
+    playouts and seconds accumulate over the player's moves, so
+    playouts / seconds is the search speed. Call close() when done if
+    workers > 1, to stop the worker processes.
+    """
+
+    def __init__(self, budget=0.05, workers=1, exploration=1.4, seed=None):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.budget = budget
+        self.workers = workers
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self.tree = _Tree()
+        self.playouts = 0
+        self.seconds = 0.0
+        self._pool = None
+
+    def choose_move(self, board, mark):
+        """Pick a square for `mark` ("X" or "O") on a GomokuBoard."""
+        if board.result is not None:
+            raise ValueError("The game is already over")
+        if self.workers > 1 and self._pool is None:
+            self._start_pool()
+        start = time.perf_counter()
+        if self.workers == 1:
+            root = self.tree.position(board, mark, self.rng)
+            self.playouts += search(root, board, start + self.budget, self.rng, self.exploration)
+            stats = root_stats(root)
+        else:
+            stats = self._search_parallel(board, mark)
+        self.seconds += time.perf_counter() - start
+        # The most visited move, the usual robust choice; ties go to the better win rate
+        return max(stats, key=lambda move: (stats[move][0], stats[move][1]))
+
+    def _start_pool(self):
+        """Start the worker processes and wait until each has run a task."""
+        from concurrent.futures import ProcessPoolExecutor
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        for future in [self._pool.submit(_ready) for _ in range(self.workers)]:
+            future.result()
+
+    def _search_parallel(self, board, mark):
+        deadline = time.time() + max(self.budget - IPC_MARGIN, self.budget / 2)
+        futures = [self._pool.submit(_search_task, board.size, board.k, board.moves, mark, deadline,
+                                     self.exploration, self.rng.randrange(1 << 32))
+                   for _ in range(self.workers)]
+        stats = {}
+        for future in futures:
+            worker_stats, playouts = future.result()
+            self.playouts += playouts
+            for move, (visits, wins) in worker_stats.items():
+                total = stats.get(move, (0, 0.0))
+                stats[move] = (total[0] + visits, total[1] + wins)
+        return stats
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
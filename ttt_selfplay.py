@@ -0,0 +1,188 @@
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ttt_ai import PerfectPlayer, load_table
+from ttt_engine import FULL, WINS
+
+CORNERS = (0, 2, 6, 8)
+
+class Policy:
+    """A move policy: for each position, a fixed set of squares to pick from at random.
+
+    Candidates are computed once per position and memoised, so after warm-up
+    a move is one dict lookup and one random draw. Subclasses implement
+    _candidates(me, opp).
+    """
+
+    name = None
+
+    def __init__(self):
+        self._cache = {}
+
+    def candidates(self, me, opp):
+        key = (me << 9) | opp
+        squares = self._cache.get(key)
+        if squares is None:
+            squares = self._cache[key] = tuple(self._candidates(me, opp))
+        return squares
+
+    def _candidates(self, me, opp):
+        raise NotImplementedError
+
+def _empty_squares(me, opp):
+    empty = FULL & ~(me | opp)
+    return [square for square in range(9) if empty >> square & 1]
+
+class RandomPolicy(Policy):
+    name = 'random'
+
+    def _candidates(self, me, opp):
+        return _empty_squares(me, opp)
+
+class HeuristicPolicy(Policy):
+    """Win if possible, else block, else centre, else a corner, else anything."""
+    name = 'heuristic'
+
+    def _candidates(self, me, opp):
+        empty = _empty_squares(me, opp)
+        wins = [s for s in empty if WINS[me | 1 << s]]
+        if wins:
+            return wins
+        blocks = [s for s in empty if WINS[opp | 1 << s]]
+        if blocks:
+            return blocks
+        if 4 in empty:
+            return [4]
+        corners = [s for s in CORNERS if s in empty]
+        return corners or empty
+
+class OptimalPolicy(Policy):
+    name = 'optimal'
+
+    def __init__(self, table=None):
+        super().__init__()
+        self._player = PerfectPlayer(table=table if table is not None else load_table())
+
+    def _candidates(self, me, opp):
+        return self._player.best_moves(me, opp)
+
+POLICIES = {cls.name: cls for cls in (RandomPolicy, HeuristicPolicy, OptimalPolicy)}
+
+class SelfPlayStats:
+    """Win/draw/loss counts, game lengths and per-opening results; mergeable."""
+
+    __slots__ = ('games', 'x_wins', 'o_wins', 'draws', 'lengths', 'openings')
+
+    def __init__(self):
+        self.games = 0
+        self.x_wins = 0
+        self.o_wins = 0
+        self.draws = 0
+        self.lengths = [0] * 10          # lengths[n] = games that ended after n moves
+        self.openings = [[0, 0, 0] for _ in range(9)]  # first square -> [X wins, O wins, draws]
+
+    def merge(self, other):
+        self.games += other.games
+        self.x_wins += other.x_wins
+        self.o_wins += other.o_wins
+        self.draws += other.draws
+        for n in range(10):
+            self.lengths[n] += other.lengths[n]
+        for square in range(9):
+            for i in range(3):
+                self.openings[square][i] += other.openings[square][i]
+        return self
+
+    def report(self):
+        """Return the summary as a list of printable lines."""
+        games = self.games or 1
+        lines = [
+            f"Games: {self.games}",
+            f"X wins: {self.x_wins} ({self.x_wins / games:.1%})  "
+            f"O wins: {self.o_wins} ({self.o_wins / games:.1%})  "
+            f"Draws: {self.draws} ({self.draws / games:.1%})",
+            "Game length: " + "  ".join(f"{n}:{count}" for n, count in enumerate(self.lengths) if count),
+            "Opening   games    X win    O win     draw",
+        ]
+        for square, (x, o, d) in enumerate(self.openings):
+            total = x + o + d
+            if total:
+                lines.append(f"{square:>7} {total:>7} {x / total:>8.1%} {o / total:>8.1%} {d / total:>8.1%}")
+        return lines
+
+def play_games(count, x_policy, o_policy, seed=None):
+    """Play `count` headless games and return their SelfPlayStats."""
+    rng = random.Random(seed)
+    draw = rng.random
+    pick = (x_policy.candidates, o_policy.candidates)
+    stats = SelfPlayStats()
+    lengths, openings = stats.lengths, stats.openings
+    x_wins = o_wins = draws = 0
+    for _ in range(count):
+        me = opp = 0
+        first = -1
+        for ply in range(9):
+            squares = pick[ply & 1](me, opp)
+            square = squares[0] if len(squares) == 1 else squares[int(draw() * len(squares))]
+            if ply == 0:
+                first = square
+            me |= 1 << square
+            if WINS[me]:
+                if ply & 1:
+                    o_wins += 1
+                    openings[first][1] += 1
+                else:
+                    x_wins += 1
+                    openings[first][0] += 1
+                lengths[ply + 1] += 1
+                break
+            me, opp = opp, me
+        else:
+            draws += 1
+            openings[first][2] += 1
+            lengths[9] += 1
+    stats.games, stats.x_wins, stats.o_wins, stats.draws = count, x_wins, o_wins, draws
+    return stats
+
+def _worker(count, x_name, o_name, seed):
+    return play_games(count, POLICIES[x_name](), POLICIES[o_name](), seed)
+
+def simulate(games, x_name='random', o_name='random', workers=1, seed=None):
+    """Play `games` games between two named policies, across `workers` processes."""
+    if workers == 1:
+        return _worker(games, x_name, o_name, seed)
+    if x_name == 'optimal' or o_name == 'optimal':
+        load_table()  # solve once here rather than racing to write it in every worker
+    base = seed if seed is not None else random.randrange(1 << 30)
+    shares = [games // workers + (i < games % workers) for i in range(workers)]
+    stats = SelfPlayStats()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_worker, share, x_name, o_name, base + i) for i, share in enumerate(shares) if share]
+        for future in futures:
+            stats.merge(future.result())
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Tic-Tac-Toe self-play between two policies.")
+    parser.add_argument('-n', '--games', type=int, default=100_000)
+    parser.add_argument('-x', dest='x_policy', choices=sorted(POLICIES), default='random', help="policy playing X")
+    parser.add_argument('-o', dest='o_policy', choices=sorted(POLICIES), default='random', help="policy playing O")
+    parser.add_argument('-j', '--workers', type=int, default=0, help="worker processes (0 = one per CPU)")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = simulate(args.games, args.x_policy, args.o_policy, args.workers or os.cpu_count() or 1, args.seed)
+    elapsed = time.perf_counter() - start
+    print(f"{args.x_policy} (X) vs {args.o_policy} (O)")
+    for line in stats.report():
+        print(line)
+    print(f"{elapsed:.2f}s, {stats.games / elapsed * 60:,.0f} games/minute", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())